@@ -10,6 +10,8 @@ Usage:
     python run_tests.py              # Run all tests
     python run_tests.py --unit       # Run only unit tests
     python run_tests.py --integration # Run only integration tests
+    python run_tests.py --isolate    # Run unit tests in a separate process
+    python run_tests.py --no-cache   # Ignore cached unit test results
     python run_tests.py --help       # Show help
 """
 
@@ -17,68 +19,147 @@ import sys
 import argparse
 import subprocess
 import os
+import json
+import time
+import hashlib
+import functools
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def run_unit_tests():
-    """Run unit tests comparing Python and JavaScript implementations"""
-    print("🧪 Running Unit Tests (Python vs JavaScript comparison)")
-    print("=" * 60)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REQUIRED_FILES = [
+    os.path.join(SCRIPT_DIR, f) for f in (
+        'upsnpscalculator.py',
+        'upsnpscalculator.js',
+        'test_calculator.py',
+        'test_calculator_integration.py'
+    )
+]
+
+# Successful dependency checks are remembered for a day
+DEPS_CACHE_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'upsornps', 'deps.json'
+)
+DEPS_CACHE_MAX_AGE = 24 * 60 * 60
+
+def _run_test_script(title, script, label, capture_output=False, script_args=()):
+    """
+    Run a test script with the current interpreter.
+
+    When capture_output is True the script's stdout/stderr are buffered and
+    returned with the title so that concurrently running suites can be
+    reported one after another. Returns a (success, output) tuple; output is
+    an empty string when the script streams directly to the console.
+    """
+    header = f"{title}\n{'=' * 60}\n"
+    if not capture_output:
+        print(header, end="")
     
     try:
         result = subprocess.run([
-            sys.executable, 'test_calculator.py'
-        ], cwd=os.path.dirname(os.path.abspath(__file__)))
-        return result.returncode == 0
+            sys.executable, script, *script_args
+        ], cwd=SCRIPT_DIR, env={**os.environ, 'PYTHONUNBUFFERED': '1'},
+           stdout=subprocess.PIPE if capture_output else None,
+           stderr=subprocess.STDOUT if capture_output else None,
+           text=True)
+        output = header + result.stdout if capture_output else ""
+        return result.returncode == 0, output
     except Exception as e:
-        print(f"❌ Failed to run unit tests: {e}")
-        return False
+        error = f"❌ Failed to run {label}: {e}\n"
+        if not capture_output:
+            print(error, end="")
+        return False, header + error if capture_output else ""
 
-def run_integration_tests():
-    """Run integration tests for calculator workflows"""
-    print("🔄 Running Integration Tests (Complete workflows)")
-    print("=" * 60)
+def run_unit_tests(capture_output=False, isolate=False, use_cache=True):
+    """
+    Run unit tests comparing Python and JavaScript implementations.
     
+    The tests run inside this interpreter unless isolate is True (or the
+    test module cannot be imported), in which case test_calculator.py is
+    started as a separate process. In-process runs always stream their
+    output, so they ignore capture_output. With use_cache False, results
+    cached by earlier runs are ignored.
+    """
+    title = "🧪 Running Unit Tests (Python vs JavaScript comparison)"
+    if not isolate:
+        try:
+            from test_calculator import run as run_unit
+        except ImportError:
+            run_unit = None
+        
+        if run_unit is not None:
+            print(f"{title}\n{'=' * 60}")
+            try:
+                return run_unit(use_cache=use_cache), ""
+            except Exception as e:
+                print(f"❌ Failed to run unit tests: {e}")
+                return False, ""
+    
+    return _run_test_script(title, 'test_calculator.py', "unit tests", capture_output,
+                            () if use_cache else ('--no-cache',))
+
+def run_integration_tests(capture_output=False):
+    """Run integration tests for calculator workflows"""
+    return _run_test_script("🔄 Running Integration Tests (Complete workflows)",
+                            'test_calculator_integration.py', "integration tests", capture_output)
+
+def _dependency_cache_key():
+    """Hash the Python version and the required files' mtimes, or None if a file is missing"""
     try:
-        result = subprocess.run([
-            sys.executable, 'test_calculator_integration.py'
-        ], cwd=os.path.dirname(os.path.abspath(__file__)))
-        return result.returncode == 0
-    except Exception as e:
-        print(f"❌ Failed to run integration tests: {e}")
+        mtimes = sorted((path, os.path.getmtime(path)) for path in REQUIRED_FILES)
+    except OSError:
+        return None
+    return hashlib.sha1(str((sys.version_info[:3], mtimes)).encode()).hexdigest()
+
+def _load_dependency_cache(key):
+    """Return True if a successful check with this key was cached within the last day"""
+    try:
+        with open(DEPS_CACHE_FILE) as f:
+            cache = json.load(f)
+        return (cache.get('key') == key and cache.get('ok') is True
+                and time.time() - cache.get('timestamp', 0) < DEPS_CACHE_MAX_AGE)
+    except (OSError, ValueError, AttributeError):
         return False
 
+def _save_dependency_cache(key):
+    """Remember a successful dependency check"""
+    try:
+        os.makedirs(os.path.dirname(DEPS_CACHE_FILE), exist_ok=True)
+        with open(DEPS_CACHE_FILE, 'w') as f:
+            json.dump({'key': key, 'ok': True, 'timestamp': time.time()}, f)
+    except OSError:
+        pass
+
 def check_dependencies():
     """Check if all required dependencies are available"""
     print("🔍 Checking Dependencies...")
     
+    # Skip the checks if they passed recently for the same files and Python
+    cache_key = _dependency_cache_key()
+    if cache_key is not None and _load_dependency_cache(cache_key):
+        print("  ✅ All dependencies satisfied (cached)")
+        return True
+    
     issues = []
     
     # Check Python version
     if sys.version_info < (3, 6):
         issues.append("Python 3.6 or higher is required")
     
-    # Check if Node.js is available
-    try:
-        result = subprocess.run(['node', '--version'], 
-                              capture_output=True, 
-                              text=True, 
-                              check=True)
-        print(f"  ✅ Node.js: {result.stdout.strip()}")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if Node.js is available (a PATH lookup, without starting node)
+    node_path = shutil.which('node')
+    if node_path:
+        print(f"  ✅ Node.js at {node_path}")
+    else:
         issues.append("Node.js is not available")
     
-    # Check if required files exist
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    required_files = [
-        'upsnpscalculator.py',
-        'upsnpscalculator.js',
-        'test_calculator.py',
-        'test_calculator_integration.py'
-    ]
-    
-    for file in required_files:
-        file_path = os.path.join(script_dir, file)
-        if os.path.exists(file_path):
+    # Check if required files exist with a single directory listing
+    present = {entry.name for entry in os.scandir(SCRIPT_DIR)}
+    for file_path in REQUIRED_FILES:
+        file = os.path.basename(file_path)
+        if file in present:
             print(f"  ✅ {file}")
         else:
             issues.append(f"Required file missing: {file}")
@@ -90,6 +171,8 @@ def check_dependencies():
         return False
     
     print("  ✅ All dependencies satisfied")
+    if cache_key is not None:
+        _save_dependency_cache(cache_key)
     return True
 
 def main():
@@ -102,6 +185,7 @@ Examples:
   python run_tests.py              # Run all tests
   python run_tests.py --unit       # Run only unit tests  
   python run_tests.py --integration # Run only integration tests
+  python run_tests.py --isolate    # Run unit tests in a separate process
         """
     )
     
@@ -111,6 +195,10 @@ Examples:
                        help='Run only integration tests (workflow validation)')
     parser.add_argument('--skip-deps', action='store_true',
                        help='Skip dependency checks')
+    parser.add_argument('--isolate', action='store_true',
+                       help='Run unit tests in a separate Python process')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Re-run unit test cases that passed in an earlier run')
     
     args = parser.parse_args()
     
@@ -123,6 +211,8 @@ Examples:
     if not args.skip_deps:
         if not check_dependencies():
             sys.exit(1)
+        # Let the test suites (in-process or child processes) skip their own checks
+        os.environ['UPSNPS_DEPS_OK'] = '1'
         print()
     
     # Determine which tests to run
@@ -136,19 +226,31 @@ Examples:
         run_unit = False
         run_integration = True
     
-    results = []
-    
-    # Run unit tests
+    suites = []
     if run_unit:
-        unit_success = run_unit_tests()
-        results.append(("Unit Tests", unit_success))
-        print()
-    
-    # Run integration tests
+        suites.append(("Unit Tests", functools.partial(run_unit_tests, isolate=args.isolate,
+                                                              use_cache=not args.no_cache)))
     if run_integration:
-        integration_success = run_integration_tests()
-        results.append(("Integration Tests", integration_success))
+        suites.append(("Integration Tests", run_integration_tests))
+    
+    results = []
+    
+    if len(suites) == 1:
+        # A single suite streams its output directly
+        test_name, run_suite = suites[0]
+        success, _ = run_suite()
+        results.append((test_name, success))
         print()
+    else:
+        # Run the suites concurrently and report them in a fixed order;
+        # in-process unit tests stream live while the others are buffered
+        with ThreadPoolExecutor(max_workers=len(suites)) as executor:
+            futures = [(test_name, executor.submit(run_suite, capture_output=True))
+                       for test_name, run_suite in suites]
+            for test_name, future in futures:
+                success, output = future.result()
+                print(output)
+                results.append((test_name, success))
     
     # Print overall summary
     print("📊 OVERALL TEST SUMMARY")
@@ -11,11 +11,34 @@ import json
 import subprocess
 import sys
 import os
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Union
 import math
+import multiprocessing
+import multiprocessing.util
+import tempfile
+import atexit
+import argparse
+import hashlib
+import shutil
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from py_mini_racer import MiniRacer
+except ImportError:
+    # Without MiniRacer the tests talk to a Node.js subprocess instead
+    MiniRacer = None
+
+try:
+    import msgpack
+except ImportError:
+    # Only needed for UPSNPS_WIRE=msgpack
+    msgpack = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Import the Python calculator functions
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPT_DIR)
 from upsnpscalculator import (
     calculate_final_salary,
     calculate_ups_monthly_pension,
@@ -25,6 +48,125 @@ from upsnpscalculator import (
     format_amount
 )
 
+# Test definitions: (test name, Python function, JavaScript function, test cases)
+TEST_GROUPS: List[Tuple[str, str, str, List[Tuple[str, List[Any]]]]] = [
+    ("calculate_final_salary", "calculate_final_salary", "calculateFinalSalary", [
+        ("regular_case", [3600000, 0.07, 7]),
+        ("zero_growth", [3600000, 0.0, 7]),
+        ("zero_years", [3600000, 0.07, 0]),
+        ("high_growth", [3600000, 0.15, 10]),
+        ("small_salary", [100000, 0.05, 5]),
+        ("large_salary", [10000000, 0.03, 15]),
+        ("negative_years", [3600000, 0.07, -1]),  # Edge case
+    ]),
+    ("calculate_ups_monthly_pension", "calculate_ups_monthly_pension", "calculateUPSMonthlyPension", [
+        ("regular_25_years", [6000000, 25]),
+        ("regular_32_years", [6000000, 32]),  # More than 25 years
+        ("partial_service", [6000000, 15]),
+        ("minimum_service", [6000000, 1]),
+        ("zero_service", [6000000, 0]),
+        ("large_salary", [50000000, 25]),
+        ("small_salary", [500000, 25]),
+        ("negative_service", [6000000, -1]),  # Edge case
+    ]),
+    ("calculate_ups_lump_sum", "calculate_ups_lump_sum", "calculateUPSLumpSum", [
+        ("regular_25_years", [6000000, 25]),
+        ("regular_32_years", [6000000, 32]),
+        ("partial_service", [6000000, 15]),
+        ("minimum_service", [6000000, 1]),
+        ("zero_service", [6000000, 0]),
+        ("large_salary", [50000000, 25]),
+        ("small_salary", [500000, 25]),
+        ("negative_service", [6000000, -1]),  # Edge case
+    ]),
+    ("calculate_nps_corpus", "calculate_nps_corpus", "calculateNPSCorpus", [
+        ("regular_case", [3600000, 0.07, 7, 0.24, 0.095, 12000000]),
+        ("zero_existing", [3600000, 0.07, 7, 0.24, 0.095, 0]),
+        ("zero_contrib", [3600000, 0.07, 7, 0.0, 0.095, 12000000]),
+        ("zero_return", [3600000, 0.07, 7, 0.24, 0.0, 12000000]),
+        ("high_return", [3600000, 0.07, 7, 0.24, 0.20, 12000000]),
+        ("long_period", [3600000, 0.07, 30, 0.24, 0.095, 12000000]),
+        ("short_period", [3600000, 0.07, 1, 0.24, 0.095, 12000000]),
+        ("zero_years", [3600000, 0.07, 0, 0.24, 0.095, 12000000]),
+    ]),
+    ("calculate_nps_monthly_pension", "calculate_nps_monthly_pension", "calculateNPSMonthlyPension", [
+        ("regular_corpus", [50000000, 0.07]),
+        ("small_corpus", [1000000, 0.07]),
+        ("large_corpus", [200000000, 0.07]),
+        ("zero_corpus", [0, 0.07]),
+        ("zero_rate", [50000000, 0.0]),
+        ("high_rate", [50000000, 0.15]),
+        ("negative_rate", [50000000, -0.05]),  # Edge case
+    ]),
+    ("format_amount", "format_amount", "formatAmount", [
+        ("lakhs", [1500000]),
+        ("thousands", [50000]),
+        ("hundreds", [500]),
+        ("zero", [0]),
+        ("exactly_1_lakh", [100000]),
+        ("exactly_1000", [1000]),
+        ("decimal", [156789.45]),
+        ("large_number", [50000000]),
+        ("negative", [-1500000]),  # Edge case
+    ]),
+]
+
+# Everything from this line on in upsnpscalculator.js is the Node.js entry point
+JS_MAIN_EXECUTION_MARKER = '// For Node.js environments, only run if this is the entry point'
+
+# Passing results from earlier runs, keyed to a hash of the sources under test
+RESULT_CACHE_FILE = os.path.join(SCRIPT_DIR, '.pytest_cache_local.json')
+
+# Wire format for the Node.js test server: 'json' (default) or 'msgpack'
+JS_WIRE_FORMAT = os.environ.get('UPSNPS_WIRE', 'json')
+
+# Node.js server loop for line-delimited JSON requests
+JSON_SERVER_JS = """
+// Serve test requests, one JSON object per line
+const readline = require('readline');
+const rl = readline.createInterface({ input: process.stdin });
+
+rl.on('line', (line) => {
+    process.stdout.write(handleRequest(line) + '\\n');
+});
+"""
+
+# Node.js server loop for length-prefixed msgpack requests (needs @msgpack/msgpack)
+MSGPACK_SERVER_JS = """
+// Serve test requests, each a msgpack payload after a 4-byte little-endian length
+const { encode, decode } = require(require.resolve('@msgpack/msgpack', { paths: [process.cwd()] }));
+let pending = Buffer.alloc(0);
+
+function writeFrame(response) {
+    const payload = encode(response);
+    const header = Buffer.alloc(4);
+    header.writeUInt32LE(payload.length, 0);
+    process.stdout.write(Buffer.concat([header, Buffer.from(payload.buffer, payload.byteOffset, payload.byteLength)]));
+}
+
+process.stdin.on('data', (chunk) => {
+    pending = Buffer.concat([pending, chunk]);
+    while (pending.length >= 4) {
+        const length = pending.readUInt32LE(0);
+        if (pending.length < 4 + length) {
+            break;
+        }
+        const frame = pending.subarray(4, 4 + length);
+        pending = pending.subarray(4 + length);
+        let response;
+        try {
+            response = handleTestData(decode(frame));
+        } catch (error) {
+            response = { id: null, success: false, error: error.message };
+        }
+        writeFrame(response);
+    }
+});
+"""
+
+# Maximum number of requests written to the Node.js server before reading replies
+JS_BATCH_SIZE = 256
+
 class TestResult:
     """Class to store test results and comparisons"""
     def __init__(self, test_name: str, python_result: Any, js_result: Any, 
@@ -38,13 +180,50 @@ class TestResult:
 class CalculatorTester:
     """Main test class for comparing Python and JavaScript calculator implementations"""
     
-    def __init__(self, tolerance: float = 1e-6):
+    # Bound once so _compare_results avoids repeated math attribute lookups
+    _isclose = staticmethod(math.isclose)
+    _isnan = staticmethod(math.isnan)
+    _isinf = staticmethod(math.isinf)
+    
+    def __init__(self, tolerance: float = 1e-6, use_node: bool = False, use_cache: bool = False):
         self.tolerance = tolerance
         self.test_results: List[TestResult] = []
+        # Stream per-case progress even when stdout is a pipe
+        if hasattr(sys.stdout, 'reconfigure'):
+            sys.stdout.reconfigure(line_buffering=True)
+        self.use_node = use_node or MiniRacer is None
+        self.wire = JS_WIRE_FORMAT
+        if self.wire not in ('json', 'msgpack'):
+            raise ValueError(f"Unknown UPSNPS_WIRE format: {self.wire}")
+        if self.wire == 'msgpack' and msgpack is None:
+            raise RuntimeError("UPSNPS_WIRE=msgpack requires the msgpack package (pip install msgpack)")
+        self.use_cache = use_cache
+        self._result_cache: Dict[str, Dict[str, Any]] = self._load_result_cache() if use_cache else {}
         self.js_test_script = self._create_js_test_script()
+        self._js_script_path: Optional[str] = None
+        self._js_process: Optional[subprocess.Popen] = None
+        self._js_context: Optional["MiniRacer"] = None
+        self._next_request_id = 0
+        # Reusable compact JSON codec for the request/response protocol
+        self._json_encode = json.JSONEncoder(separators=(',', ':')).encode
+        self._json_decode = json.JSONDecoder().decode
+        # All JavaScript calls go through one thread so that requests to the
+        # runtime never interleave, while the caller computes Python results
+        self._js_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='js-runner')
+        # The tested JS functions are pure, so identical calls can share a result
+        self._js_cache: Dict[Tuple[Any, ...], Tuple[bool, Any]] = {}
     
     def _create_js_test_script(self) -> str:
-        """Create a JavaScript test script that can be executed by Node.js"""
+        """
+        Create a JavaScript test server that can be executed by Node.js.
+        
+        The server loads the calculator once, then reads one JSON request
+        ({id, function, args}) per line from stdin and answers each with one
+        JSON line ({id, success, result|error}) on stdout. With
+        UPSNPS_WIRE=msgpack the same messages are msgpack-encoded instead,
+        each framed by a 4-byte little-endian length. The server is only
+        used when MiniRacer is unavailable or Node.js is requested explicitly.
+        """
         return """
 // Load the calculator functions
 const fs = require('fs');
@@ -57,7 +236,7 @@ let skipMainExecution = false;
 
 for (let i = 0; i < lines.length; i++) {
     const line = lines[i];
-    if (line.includes('// For Node.js environments, only run if this is the entry point')) {
+    if (line.includes('""" + JS_MAIN_EXECUTION_MARKER + """')) {
         skipMainExecution = true;
     }
     if (!skipMainExecution) {
@@ -70,6 +249,17 @@ const cleanCode = cleanLines.join('\\n');
 // Execute the calculator code in the global context
 eval(cleanCode);
 
+""" + self._create_js_runner_code() + (MSGPACK_SERVER_JS if self.wire == 'msgpack' else JSON_SERVER_JS)
+    
+    def _create_js_runner_code(self) -> str:
+        """
+        Create the runtime-independent part of the JavaScript test runner.
+        
+        Expects the calculator functions to be defined already and provides
+        handleRequest(line), which maps one JSON request to one JSON response,
+        and handleTestData(testData) for already decoded requests.
+        """
+        return """
 // Test runner function
 function runTest(functionName, args) {
     try {
@@ -102,60 +292,213 @@ function runTest(functionName, args) {
     }
 }
 
-// Read test input from stdin
-const input = process.argv[2];
-if (input) {
-    const testData = JSON.parse(input);
-    const result = runTest(testData.function, testData.args);
-    console.log(JSON.stringify(result));
-} else {
-    console.log(JSON.stringify({ success: false, error: "No test data provided" }));
+// Answer one decoded request ({id, function, args}) with a response object
+function handleTestData(testData) {
+    return Object.assign({ id: testData.id }, runTest(testData.function, testData.args));
+}
+
+// Answer one JSON request line with one JSON response line
+function handleRequest(line) {
+    let response;
+    try {
+        response = handleTestData(JSON.parse(line));
+    } catch (error) {
+        response = { id: null, success: false, error: error.message };
+    }
+    return JSON.stringify(response);
 }
 """
     
-    def _run_js_function(self, function_name: str, args: List[Any]) -> Tuple[bool, Any]:
-        """Execute a JavaScript function with given arguments"""
+    def _create_js_context(self) -> "MiniRacer":
+        """Load the calculator and test runner into an in-process V8 context"""
+        with open(os.path.join(SCRIPT_DIR, 'upsnpscalculator.js')) as f:
+            calc_code = f.read()
+        # Remove main execution to avoid console output
+        calc_code = calc_code.split(JS_MAIN_EXECUTION_MARKER)[0]
+        
+        context = MiniRacer()
+        context.eval(calc_code)
+        context.eval(self._create_js_runner_code())
+        return context
+    
+    def _ensure_js_runtime(self) -> None:
+        """
+        Create the JavaScript runtime on first use.
+        
+        A tester that only shards its cases across worker processes never
+        calls JavaScript itself, so it never builds a runtime.
+        """
+        if self.use_node:
+            if self._js_script_path is None:
+                # Write the JS test script once to a private temporary file
+                fd, self._js_script_path = tempfile.mkstemp(prefix='js_test_runner_', suffix='.js')
+                os.write(fd, self.js_test_script.encode())
+                os.close(fd)
+                atexit.register(self._remove_js_script)
+        elif self._js_context is None:
+            # Evaluate the calculator in-process instead of talking to Node.js
+            self._js_context = self._create_js_context()
+    
+    def _start_js_server(self) -> subprocess.Popen:
+        """Start the persistent Node.js test server if it is not already running"""
+        self._ensure_js_runtime()
+        if self._js_process is None or self._js_process.poll() is not None:
+            self._js_process = subprocess.Popen(
+                ['node', self._js_script_path],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                cwd=SCRIPT_DIR
+            )
+        return self._js_process
+    
+    def _remove_js_script(self) -> None:
+        """Delete the temporary JS test script"""
+        if self._js_script_path is None:
+            return
+        try:
+            os.unlink(self._js_script_path)
+        except FileNotFoundError:
+            pass
+    
+    def close(self) -> None:
+        """Shut down the JavaScript runtime and remove the test script"""
+        self._js_executor.shutdown(wait=True)
+        if self._js_context is not None:
+            if hasattr(self._js_context, 'close'):
+                self._js_context.close()
+            self._js_context = None
+        if self._js_process is not None:
+            self._js_process.stdin.close()
+            self._js_process.wait()
+            self._js_process.stdout.close()
+            self._js_process.stderr.close()
+            self._js_process = None
+        self._remove_js_script()
+    
+    def _run_js_batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Tuple[bool, Any]]:
+        """
+        Execute many JavaScript function calls, reusing earlier results.
+        
+        Calls that are not cached yet are deduplicated and sent in chunks of
+        JS_BATCH_SIZE requests. The Node.js server receives each chunk as one
+        pipelined write, so a whole shard of test cases costs one round trip
+        per chunk instead of one per case.
+        """
+        keys = [(function_name, tuple(args)) for function_name, args in calls]
+        results = {key: self._js_cache[key] for key in keys if key in self._js_cache}
+        pending = [key for key in dict.fromkeys(keys) if key not in results]
+        
+        for start in range(0, len(pending), JS_BATCH_SIZE):
+            chunk = pending[start:start + JS_BATCH_SIZE]
+            responses = self._call_js_batch(chunk)
+            healthy = (not self.use_node
+                       or (self._js_process is not None and self._js_process.poll() is None))
+            for key, response in zip(chunk, responses):
+                results[key] = response
+                if healthy:
+                    # Only cache answers from a healthy server, not transport failures
+                    self._js_cache[key] = response
+        
+        return [results[key] for key in keys]
+    
+    def _call_js_batch(self, calls: List[Tuple[str, Tuple[Any, ...]]]) -> List[Tuple[bool, Any]]:
+        """Send a batch of function calls to the JavaScript runtime"""
+        self._ensure_js_runtime()
         try:
-            # Write the JS test script to a temporary file
-            js_script_path = '/tmp/js_test_runner.js'
-            with open(js_script_path, 'w') as f:
-                f.write(self.js_test_script)
-            
             # Prepare test data
-            test_data = {
-                'function': function_name,
-                'args': args
-            }
+            requests = []
+            for function_name, args in calls:
+                self._next_request_id += 1
+                requests.append({
+                    'id': self._next_request_id,
+                    'function': function_name,
+                    'args': list(args)
+                })
             
-            # Run the JavaScript test
-            result = subprocess.run([
-                'node', js_script_path, json.dumps(test_data)
-            ], capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+            if not self.use_node:
+                return [
+                    self._parse_js_response(test_data['id'],
+                                            self._js_context.call('handleRequest', self._json_encode(test_data)),
+                                            self._json_decode)
+                    for test_data in requests
+                ]
             
-            if result.returncode != 0:
-                return False, f"JS execution error: {result.stderr}"
+            # Send all requests, then collect one response per request
+            process = self._start_js_server()
+            if self.wire == 'msgpack':
+                payloads = [msgpack.packb(test_data) for test_data in requests]
+                process.stdin.write(b''.join(struct.pack('<I', len(payload)) + payload
+                                             for payload in payloads))
+                read_response, decode = self._read_frame, msgpack.unpackb
+            else:
+                process.stdin.write(''.join(self._json_encode(test_data) + '\n'
+                                            for test_data in requests).encode())
+                read_response, decode = self._read_line, self._json_decode
+            process.stdin.flush()
             
-            # Parse the result
-            try:
-                js_result = json.loads(result.stdout.strip())
-                if js_result['success']:
-                    return True, js_result['result']
-                else:
-                    return False, js_result['error']
-            except json.JSONDecodeError as e:
-                return False, f"JSON parse error: {e}, output: {result.stdout}"
+            results: List[Tuple[bool, Any]] = []
+            for test_data in requests:
+                output = read_response(process.stdout)
+                if not output:
+                    process.wait()
+                    stderr = process.stderr.read().decode('utf-8', errors='replace')
+                    error = f"JS execution error: {stderr}"
+                    results.extend([(False, error)] * (len(requests) - len(results)))
+                    break
+                results.append(self._parse_js_response(test_data['id'], output, decode))
+            return results
                 
         except Exception as e:
-            return False, f"Exception running JS: {e}"
+            return [(False, f"Exception running JS: {e}")] * len(calls)
+    
+    @staticmethod
+    def _read_line(stream) -> str:
+        """Read one line-delimited JSON response"""
+        return stream.readline().decode('utf-8', errors='replace')
+    
+    @staticmethod
+    def _read_frame(stream) -> bytes:
+        """Read one length-prefixed msgpack response, or b'' at end of stream"""
+        header = stream.read(4)
+        if len(header) < 4:
+            return b''
+        (length,) = struct.unpack('<I', header)
+        return stream.read(length)
+    
+    def _parse_js_response(self, request_id: int, output: Union[str, bytes],
+                           decode) -> Tuple[bool, Any]:
+        """
+        Parse one response from the JavaScript test runner.
+        
+        msgpack responses arrive as raw bytes, which msgpack.unpackb accepts
+        directly; they are only decoded to text to build an error message.
+        """
+        try:
+            js_result = decode(output)
+        except Exception as e:
+            return False, f"Response parse error: {e}, output: {self._decode_output(output)}"
+        if not isinstance(js_result, dict) or js_result.get('id') != request_id:
+            return False, f"Unexpected JS response: {self._decode_output(output).strip()}"
+        if js_result.get('success'):
+            return True, js_result.get('result')
+        else:
+            return False, js_result.get('error')
+    
+    @staticmethod
+    def _decode_output(output: Union[str, bytes]) -> str:
+        """Decode runner output for error messages"""
+        if isinstance(output, bytes):
+            return output.decode('utf-8', errors='replace')
+        return output
     
     def _compare_results(self, python_result: Any, js_result: Any) -> Tuple[bool, str]:
         """Compare Python and JavaScript results with appropriate tolerance"""
         if isinstance(python_result, (int, float)) and isinstance(js_result, (int, float)):
-            if math.isnan(python_result) and math.isnan(js_result):
+            # isclose is False for NaN and for infinities of opposite sign
+            if self._isnan(python_result) and self._isnan(js_result):
                 return True, ""
-            if math.isinf(python_result) and math.isinf(js_result):
+            if self._isinf(python_result) and self._isinf(js_result):
                 return True, ""
-            if abs(python_result - js_result) <= self.tolerance:
+            if self._isclose(python_result, js_result, rel_tol=0.0, abs_tol=self.tolerance):
                 return True, ""
             else:
                 return False, f"Numerical difference: Python={python_result}, JS={js_result}, diff={abs(python_result - js_result)}"
@@ -170,165 +513,168 @@ if (input) {
             else:
                 return False, f"Type/value difference: Python={python_result} ({type(python_result)}), JS={js_result} ({type(js_result)})"
     
-    def test_function(self, test_name: str, python_func, js_func_name: str, 
-                     test_cases: List[Tuple[str, List[Any]]]) -> None:
-        """Test a specific function with multiple test cases"""
-        print(f"\n=== Testing {test_name} ===")
+    @staticmethod
+    def _run_python_function(python_func, args: List[Any]) -> Tuple[bool, Any]:
+        """Call a Python calculator function, returning (success, result or error)"""
+        try:
+            return True, python_func(*args)
+        except Exception as e:
+            return False, e
+    
+    def _make_result(self, full_name: str, python_outcome: Tuple[bool, Any],
+                     js_outcome: Tuple[bool, Any]) -> TestResult:
+        """Compare the outcomes of both implementations for one test case"""
+        python_success, python_result = python_outcome
+        if not python_success:
+            return TestResult(full_name, None, None, False,
+                              f"Python execution failed: {python_result}")
+        
+        js_success, js_result = js_outcome
+        if not js_success:
+            return TestResult(full_name, python_result, None, False,
+                              f"JS execution failed: {js_result}")
         
-        for case_name, args in test_cases:
+        # Compare results
+        passed, error_msg = self._compare_results(python_result, js_result)
+        return TestResult(full_name, python_result, js_result, passed, error_msg)
+    
+    def _record_case(self, case_name: str, test_result: TestResult, cached: bool = False) -> None:
+        """Store a test case result and print its outcome"""
+        self.test_results.append(test_result)
+        if test_result.passed:
+            suffix = " (cached)" if cached else ""
+            print(f"  ✅ {case_name}: Python={test_result.python_result}, JS={test_result.js_result}{suffix}")
+        else:
+            print(f"  ❌ {case_name}: {test_result.error_msg}")
+    
+    def run_cases(self, tasks: List[Tuple[str, str, str, str, List[Any]]]) -> List[TestResult]:
+        """
+        Run (test, case) tasks, fetching all JavaScript results in one batch.
+        
+        The batch runs on the JS runner thread while the Python results are
+        computed, so waiting on the JavaScript runtime overlaps Python work.
+        """
+        js_future = self._js_executor.submit(
+            self._run_js_batch, [(js_func_name, args) for _, _, js_func_name, _, args in tasks])
+        python_outcomes = [self._run_python_function(globals()[py_func_name], args)
+                           for _, py_func_name, _, _, args in tasks]
+        js_outcomes = js_future.result()
+        return [
+            self._make_result(f"{test_name} - {case_name}", python_outcome, js_outcome)
+            for (test_name, _, _, case_name, _), python_outcome, js_outcome
+            in zip(tasks, python_outcomes, js_outcomes)
+        ]
+    
+    def _load_result_cache(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load results of passing test cases from earlier runs.
+        
+        The cache is tied to a hash of both calculator implementations, of
+        this test module and of the JavaScript runtime and wire format, so any
+        source change or a switch to another runtime starts a fresh cache.
+        """
+        runtime = f"node-{self.wire}" if self.use_node else "miniracer"
+        self._source_hash = self._compute_source_hash(runtime)
+        try:
+            with open(RESULT_CACHE_FILE) as f:
+                cache = json.load(f)
+            if cache.get('source_hash') == self._source_hash:
+                return cache['results']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+    
+    def _save_result_cache(self) -> None:
+        """Atomically write the result cache next to the test modules"""
+        fd, tmp_path = tempfile.mkstemp(dir=SCRIPT_DIR, prefix='.pytest_cache_local.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'source_hash': self._source_hash, 'results': self._result_cache}, f)
+            os.replace(tmp_path, RESULT_CACHE_FILE)
+        except OSError:
             try:
-                # Run Python function
-                python_result = python_func(*args)
-                
-                # Run JavaScript function
-                js_success, js_result = self._run_js_function(js_func_name, args)
-                
-                if not js_success:
-                    test_result = TestResult(
-                        f"{test_name} - {case_name}",
-                        python_result,
-                        None,
-                        False,
-                        f"JS execution failed: {js_result}"
-                    )
-                    self.test_results.append(test_result)
-                    print(f"  ❌ {case_name}: JS execution failed - {js_result}")
-                    continue
-                
-                # Compare results
-                passed, error_msg = self._compare_results(python_result, js_result)
-                
-                test_result = TestResult(
-                    f"{test_name} - {case_name}",
-                    python_result,
-                    js_result,
-                    passed,
-                    error_msg
-                )
-                self.test_results.append(test_result)
-                
-                if passed:
-                    print(f"  ✅ {case_name}: Python={python_result}, JS={js_result}")
-                else:
-                    print(f"  ❌ {case_name}: {error_msg}")
-                    
-            except Exception as e:
-                test_result = TestResult(
-                    f"{test_name} - {case_name}",
-                    None,
-                    None,
-                    False,
-                    f"Python execution failed: {e}"
-                )
-                self.test_results.append(test_result)
-                print(f"  ❌ {case_name}: Python execution failed - {e}")
-    
-    def run_all_tests(self) -> None:
-        """Run all tests for calculator functions"""
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _compute_source_hash(runtime: str) -> str:
+        """Hash the calculator sources, this test module and the JavaScript runtime name"""
+        digest = hashlib.sha1(runtime.encode())
+        for file_name in ('upsnpscalculator.py', 'upsnpscalculator.js', os.path.basename(__file__)):
+            with open(os.path.join(SCRIPT_DIR, file_name), 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()[:12]
+    
+    @staticmethod
+    def _result_cache_key(js_func_name: str, args: List[Any]) -> str:
+        """Key a test case by the function it calls and its arguments"""
+        return json.dumps([js_func_name, list(args)])
+    
+    def run_all_tests(self, processes: int = 1) -> None:
+        """
+        Run all tests for calculator functions.
+        
+        The cases run in this process by default: a single JavaScript runtime
+        answers all of them faster than extra workers can start up. With
+        processes > 1 they are sharded across a pool of worker processes, each
+        with its own runtime, and the results are reported in their original
+        order. With use_cache, cases that passed in an earlier run against the
+        same sources are not run again.
+        """
         print("UPS vs NPS Calculator Test Suite")
         print("=" * 50)
         print("Comparing Python and JavaScript implementations...")
+        print(f"JavaScript runtime: {'Node.js' if self.use_node else 'MiniRacer (in-process V8)'}")
         
-        # Test calculate_final_salary
-        self.test_function(
-            "calculate_final_salary",
-            calculate_final_salary,
-            "calculateFinalSalary",
-            [
-                ("regular_case", [3600000, 0.07, 7]),
-                ("zero_growth", [3600000, 0.0, 7]),
-                ("zero_years", [3600000, 0.07, 0]),
-                ("high_growth", [3600000, 0.15, 10]),
-                ("small_salary", [100000, 0.05, 5]),
-                ("large_salary", [10000000, 0.03, 15]),
-                ("negative_years", [3600000, 0.07, -1]),  # Edge case
-            ]
-        )
-        
-        # Test calculate_ups_monthly_pension
-        self.test_function(
-            "calculate_ups_monthly_pension",
-            calculate_ups_monthly_pension,
-            "calculateUPSMonthlyPension",
-            [
-                ("regular_25_years", [6000000, 25]),
-                ("regular_32_years", [6000000, 32]),  # More than 25 years
-                ("partial_service", [6000000, 15]),
-                ("minimum_service", [6000000, 1]),
-                ("zero_service", [6000000, 0]),
-                ("large_salary", [50000000, 25]),
-                ("small_salary", [500000, 25]),
-                ("negative_service", [6000000, -1]),  # Edge case
-            ]
-        )
+        tasks = [
+            (test_name, py_func_name, js_func_name, case_name, args)
+            for test_name, py_func_name, js_func_name, test_cases in TEST_GROUPS
+            for case_name, args in test_cases
+        ]
         
-        # Test calculate_ups_lump_sum
-        self.test_function(
-            "calculate_ups_lump_sum",
-            calculate_ups_lump_sum,
-            "calculateUPSLumpSum",
-            [
-                ("regular_25_years", [6000000, 25]),
-                ("regular_32_years", [6000000, 32]),
-                ("partial_service", [6000000, 15]),
-                ("minimum_service", [6000000, 1]),
-                ("zero_service", [6000000, 0]),
-                ("large_salary", [50000000, 25]),
-                ("small_salary", [500000, 25]),
-                ("negative_service", [6000000, -1]),  # Edge case
-            ]
-        )
+        # Reuse passing results recorded for the current sources
+        results: List[Optional[TestResult]] = [None] * len(tasks)
+        for index, (test_name, _, js_func_name, case_name, args) in enumerate(tasks):
+            entry = self._result_cache.get(self._result_cache_key(js_func_name, args))
+            if entry is not None and entry['passed']:
+                results[index] = TestResult(f"{test_name} - {case_name}", entry['python_result'],
+                                            entry['js_result'], True)
+        cached = [test_result is not None for test_result in results]
+        pending = [task for task, is_cached in zip(tasks, cached) if not is_cached]
         
-        # Test calculate_nps_corpus
-        self.test_function(
-            "calculate_nps_corpus",
-            calculate_nps_corpus,
-            "calculateNPSCorpus",
-            [
-                ("regular_case", [3600000, 0.07, 7, 0.24, 0.095, 12000000]),
-                ("zero_existing", [3600000, 0.07, 7, 0.24, 0.095, 0]),
-                ("zero_contrib", [3600000, 0.07, 7, 0.0, 0.095, 12000000]),
-                ("zero_return", [3600000, 0.07, 7, 0.24, 0.0, 12000000]),
-                ("high_return", [3600000, 0.07, 7, 0.24, 0.20, 12000000]),
-                ("long_period", [3600000, 0.07, 30, 0.24, 0.095, 12000000]),
-                ("short_period", [3600000, 0.07, 1, 0.24, 0.095, 12000000]),
-                ("zero_years", [3600000, 0.07, 0, 0.24, 0.095, 12000000]),
-            ]
-        )
+        if not pending:
+            pending_results = []
+        elif processes > 1:
+            shard_size = -(-len(pending) // processes)
+            shards = [pending[i:i + shard_size] for i in range(0, len(pending), shard_size)]
+            with multiprocessing.Pool(processes, initializer=_worker_init,
+                                      initargs=(self.use_node,)) as pool:
+                shard_results = pool.map(_run_shard, shards)
+                # Let workers exit normally so their testers are finalized
+                pool.close()
+                pool.join()
+            pending_results = [test_result for shard in shard_results for test_result in shard]
+        else:
+            pending_results = self.run_cases(pending)
         
-        # Test calculate_nps_monthly_pension
-        self.test_function(
-            "calculate_nps_monthly_pension",
-            calculate_nps_monthly_pension,
-            "calculateNPSMonthlyPension",
-            [
-                ("regular_corpus", [50000000, 0.07]),
-                ("small_corpus", [1000000, 0.07]),
-                ("large_corpus", [200000000, 0.07]),
-                ("zero_corpus", [0, 0.07]),
-                ("zero_rate", [50000000, 0.0]),
-                ("high_rate", [50000000, 0.15]),
-                ("negative_rate", [50000000, -0.05]),  # Edge case
-            ]
-        )
+        fresh_results = iter(pending_results)
+        for index, (_, _, js_func_name, _, args) in enumerate(tasks):
+            if results[index] is None:
+                test_result = results[index] = next(fresh_results)
+                if self.use_cache and test_result.passed:
+                    self._result_cache[self._result_cache_key(js_func_name, args)] = {
+                        'python_result': test_result.python_result,
+                        'js_result': test_result.js_result,
+                        'passed': True,
+                    }
         
-        # Test format_amount
-        self.test_function(
-            "format_amount",
-            format_amount,
-            "formatAmount",
-            [
-                ("lakhs", [1500000]),
-                ("thousands", [50000]),
-                ("hundreds", [500]),
-                ("zero", [0]),
-                ("exactly_1_lakh", [100000]),
-                ("exactly_1000", [1000]),
-                ("decimal", [156789.45]),
-                ("large_number", [50000000]),
-                ("negative", [-1500000]),  # Edge case
-            ]
-        )
+        current_test = None
+        for (test_name, _, _, case_name, _), test_result, is_cached in zip(tasks, results, cached):
+            if test_name != current_test:
+                print(f"\n=== Testing {test_name} ===")
+                current_test = test_name
+            self._record_case(case_name, test_result, is_cached)
     
     def print_summary(self) -> None:
         """Print test summary"""
@@ -352,39 +698,85 @@ if (input) {
                     print(f"❌ {result.test_name}")
                     print(f"   {result.error_msg}")
         
+        if self.use_cache:
+            self._save_result_cache()
+        
         return failed_tests == 0
 
-def main():
-    """Main test runner"""
-    print("Starting UPS vs NPS Calculator Test Suite...")
+# Per-process tester, so each pool worker keeps a single JavaScript runtime
+_worker_tester: Optional[CalculatorTester] = None
+
+def _worker_init(use_node: bool = False) -> None:
+    """
+    Pool initializer: build one tester per worker process.
     
+    The JavaScript runtime (MiniRacer context or Node.js server) is created
+    once here and shared by every shard the worker runs.
+    """
+    global _worker_tester
+    _worker_tester = CalculatorTester(use_node=use_node)
+    if _worker_tester.use_node:
+        _worker_tester._start_js_server()
+    multiprocessing.util.Finalize(_worker_tester, _worker_tester.close, exitpriority=10)
+
+def _run_shard(tasks: List[Tuple[str, str, str, str, List[Any]]]) -> List[TestResult]:
+    """Run a shard of (test, case) tasks in a worker process"""
+    return _worker_tester.run_cases(tasks)
+
+def _check_prerequisites(use_node: bool) -> bool:
+    """Check that Node.js (when needed) and both calculator files are available"""
     # Check if Node.js is available
-    try:
-        subprocess.run(['node', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if (use_node or MiniRacer is None) and not shutil.which('node'):
         print("❌ Error: Node.js is not available. Please install Node.js to run JavaScript tests.")
-        sys.exit(1)
+        return False
     
     # Check if the calculator files exist
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    py_calc = os.path.join(script_dir, 'upsnpscalculator.py')
-    js_calc = os.path.join(script_dir, 'upsnpscalculator.js')
+    py_calc = os.path.join(SCRIPT_DIR, 'upsnpscalculator.py')
+    js_calc = os.path.join(SCRIPT_DIR, 'upsnpscalculator.js')
     
     if not os.path.exists(py_calc):
         print(f"❌ Error: Python calculator not found at {py_calc}")
-        sys.exit(1)
+        return False
     
     if not os.path.exists(js_calc):
         print(f"❌ Error: JavaScript calculator not found at {js_calc}")
-        sys.exit(1)
+        return False
+    
+    return True
+
+def run(tester_cls=CalculatorTester, use_node: bool = False, use_cache: bool = True,
+        processes: int = 1) -> bool:
+    """Check prerequisites, run the whole unit test suite and return whether it passed"""
+    print("Starting UPS vs NPS Calculator Test Suite...")
+    
+    # run_tests.py sets UPSNPS_DEPS_OK once its own dependency check has passed
+    if not os.environ.get('UPSNPS_DEPS_OK') and not _check_prerequisites(use_node):
+        return False
     
     # Run tests
-    tester = CalculatorTester()
-    tester.run_all_tests()
+    tester = tester_cls(use_node=use_node, use_cache=use_cache)
+    try:
+        tester.run_all_tests(processes=processes)
+    finally:
+        tester.close()
+    
+    # Print summary
+    return tester.print_summary()
+
+def main():
+    """Main test runner"""
+    parser = argparse.ArgumentParser(description="Compare Python and JavaScript calculator implementations")
+    parser.add_argument('--use-node', action='store_true',
+                        help='Run the JavaScript functions in Node.js even if MiniRacer is installed')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Run every test case, ignoring results cached by earlier runs')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='Shard the test cases across this many worker processes (default: run in-process)')
+    args = parser.parse_args()
     
-    # Print summary and exit with appropriate code
-    success = tester.print_summary()
+    # Exit with appropriate code
+    success = run(use_node=args.use_node, use_cache=not args.no_cache, processes=args.processes)
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -13,10 +13,13 @@ import os
 import json
 from typing import Dict, Any, List, Tuple
 import io
-import contextlib
+import functools
+import math
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Import the Python calculator functions
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPT_DIR)
 from upsnpscalculator import (
     calculate_final_salary,
     calculate_ups_monthly_pension,
@@ -24,29 +27,50 @@ from upsnpscalculator import (
     calculate_nps_corpus,
     calculate_nps_monthly_pension,
     calculate_corpus_depletion_years,
+    calculate_ups_bundle,
+    calculate_nps_bundle,
+    _depletion_year_fast,
     format_amount
 )
+import upsnpscalculator
+
+def _buffered_output(method):
+    """Collect a check group's messages in self._log and write them in one go at the end"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            if self._log:
+                sys.stdout.write("\n".join(self._log) + "\n")
+                self._log.clear()
+    return wrapper
 
 class IntegrationTester:
     """Integration test class for complete calculator workflows"""
     
     def __init__(self):
-        self.test_results = []
+        # Parallel lists of check names, outcomes and error messages
+        self.names: List[str] = []
+        self.passed: List[bool] = []
+        self.errors: List[str] = []
         self.tolerance = 1e-6
+        # Messages of the running check group, see _buffered_output
+        self._log: List[str] = []
     
-    def capture_console_output(self, func, *args, **kwargs):
-        """Capture console output from a function"""
-        f = io.StringIO()
-        with contextlib.redirect_stdout(f):
-            result = func(*args, **kwargs)
-        return result, f.getvalue()
+    def _record(self, test_name: str, passed: bool, error_msg: str) -> None:
+        """Record the outcome of one check"""
+        self.names.append(test_name)
+        self.passed.append(passed)
+        self.errors.append(error_msg)
     
+    @_buffered_output
     def test_complete_calculation_workflow(self):
         """Test a complete calculation workflow with realistic scenarios"""
-        print("=== Testing Complete Calculation Workflows ===")
+        self._log.append("=== Testing Complete Calculation Workflows ===")
         
         # Test scenario 1: Standard government employee
-        print("\nTest 1: Standard Government Employee")
+        self._log.append("\nTest 1: Standard Government Employee")
         current_salary = 3600000  # 36L
         growth_rate = 0.07
         years = 7
@@ -67,28 +91,29 @@ class IntegrationTester:
             nps_lump_sum = nps_corpus * 0.6
             
             # Test corpus depletion with captured output
-            corpus_years, output = self.capture_console_output(
-                calculate_corpus_depletion_years,
-                nps_lump_sum, ups_monthly, nps_monthly, 20, 10, 0.05, 0.08, ups_lump_sum
+            output = io.StringIO()
+            corpus_years = calculate_corpus_depletion_years(
+                nps_lump_sum, ups_monthly, nps_monthly, 20, 10, 0.05, 0.08, ups_lump_sum,
+                output_stream=output
             )
             
-            print(f"  ✅ Final salary: {format_amount(final_salary)}")
-            print(f"  ✅ UPS monthly pension: {format_amount(ups_monthly)}")
-            print(f"  ✅ UPS lump sum: {format_amount(ups_lump_sum)}")
-            print(f"  ✅ NPS corpus: {format_amount(nps_corpus)}")
-            print(f"  ✅ NPS monthly pension: {format_amount(nps_monthly)}")
-            print(f"  ✅ NPS lump sum: {format_amount(nps_lump_sum)}")
-            print(f"  ✅ Corpus depletion years: {corpus_years}")
-            print(f"  ✅ Console output captured: {len(output.split('\\n'))} lines")
+            self._log.append(f"  ✅ Final salary: {format_amount(final_salary)}")
+            self._log.append(f"  ✅ UPS monthly pension: {format_amount(ups_monthly)}")
+            self._log.append(f"  ✅ UPS lump sum: {format_amount(ups_lump_sum)}")
+            self._log.append(f"  ✅ NPS corpus: {format_amount(nps_corpus)}")
+            self._log.append(f"  ✅ NPS monthly pension: {format_amount(nps_monthly)}")
+            self._log.append(f"  ✅ NPS lump sum: {format_amount(nps_lump_sum)}")
+            self._log.append(f"  ✅ Corpus depletion years: {corpus_years}")
+            self._log.append(f"  ✅ Console output captured: {len(output.getvalue().splitlines())} lines")
             
-            self.test_results.append(("Standard workflow", True, ""))
+            self._record("Standard workflow", True, "")
             
         except Exception as e:
-            print(f"  ❌ Standard workflow failed: {e}")
-            self.test_results.append(("Standard workflow", False, str(e)))
+            self._log.append(f"  ❌ Standard workflow failed: {e}")
+            self._record("Standard workflow", False, str(e))
         
         # Test scenario 2: Edge case - very short service
-        print("\nTest 2: Short Service Employee")
+        self._log.append("\nTest 2: Short Service Employee")
         try:
             short_service_years = 5
             ups_monthly_short = calculate_ups_monthly_pension(final_salary, short_service_years)
@@ -100,80 +125,97 @@ class IntegrationTester:
             expected_pension = full_pension * expected_proportion
             
             if abs(ups_monthly_short - expected_pension) < self.tolerance:
-                print(f"  ✅ Short service pension calculation correct: {format_amount(ups_monthly_short)}")
-                self.test_results.append(("Short service pension", True, ""))
+                self._log.append(f"  ✅ Short service pension calculation correct: {format_amount(ups_monthly_short)}")
+                self._record("Short service pension", True, "")
             else:
-                print(f"  ❌ Short service pension incorrect: got {ups_monthly_short}, expected {expected_pension}")
-                self.test_results.append(("Short service pension", False, "Incorrect calculation"))
+                self._log.append(f"  ❌ Short service pension incorrect: got {ups_monthly_short}, expected {expected_pension}")
+                self._record("Short service pension", False, "Incorrect calculation")
                 
         except Exception as e:
-            print(f"  ❌ Short service test failed: {e}")
-            self.test_results.append(("Short service pension", False, str(e)))
+            self._log.append(f"  ❌ Short service test failed: {e}")
+            self._record("Short service pension", False, str(e))
         
         # Test scenario 3: Edge case - corpus never depletes
-        print("\nTest 3: High Return Scenario (Corpus Never Depletes)")
+        self._log.append("\nTest 3: High Return Scenario (Corpus Never Depletes)")
         try:
             high_return_rate = 0.20  # 20% return
-            corpus_years_high, output_high = self.capture_console_output(
-                calculate_corpus_depletion_years,
-                nps_lump_sum, ups_monthly, nps_monthly, 20, 10, 0.05, high_return_rate, ups_lump_sum
+            corpus_years_high = calculate_corpus_depletion_years(
+                nps_lump_sum, ups_monthly, nps_monthly, 20, 10, 0.05, high_return_rate, ups_lump_sum,
+                verbose=False
             )
             
             if corpus_years_high == float('inf'):
-                print(f"  ✅ High return correctly shows infinite corpus life")
-                self.test_results.append(("High return scenario", True, ""))
+                self._log.append(f"  ✅ High return correctly shows infinite corpus life")
+                self._record("High return scenario", True, "")
+            else:
+                self._log.append(f"  ❌ High return scenario incorrect: got {corpus_years_high}, expected inf")
+                self._record("High return scenario", False, "Should be infinite")
+                
+        except Exception as e:
+            self._log.append(f"  ❌ High return test failed: {e}")
+            self._record("High return scenario", False, str(e))
+        
+        # Test scenario 4: Scripted run of the command line interface
+        self._log.append("\nTest 4: Command Line Run with Options")
+        try:
+            output = io.StringIO()
+            upsnpscalculator.main(["--corpus-return", "0.20"], output_stream=output)
+            report = output.getvalue()
+            
+            if "Estimated Results at Retirement:" in report and "NEVER deplete" in report:
+                self._log.append(f"  ✅ Command line options produce the full report")
+                self._record("Command line run", True, "")
             else:
-                print(f"  ❌ High return scenario incorrect: got {corpus_years_high}, expected inf")
-                self.test_results.append(("High return scenario", False, "Should be infinite"))
+                self._log.append(f"  ❌ Command line report is incomplete")
+                self._record("Command line run", False, "Report incomplete")
                 
         except Exception as e:
-            print(f"  ❌ High return test failed: {e}")
-            self.test_results.append(("High return scenario", False, str(e)))
+            self._log.append(f"  ❌ Command line test failed: {e}")
+            self._record("Command line run", False, str(e))
     
+    @_buffered_output
     def test_edge_cases(self):
         """Test various edge cases and boundary conditions"""
-        print("\n=== Testing Edge Cases ===")
+        self._log.append("\n=== Testing Edge Cases ===")
         
         # Test 1: Zero corpus
-        print("\nTest 1: Zero NPS Corpus")
+        self._log.append("\nTest 1: Zero NPS Corpus")
         try:
-            zero_corpus_years, _ = self.capture_console_output(
-                calculate_corpus_depletion_years,
-                0, 100000, 50000, 20, 10, 0.05, 0.08, 0
+            zero_corpus_years = calculate_corpus_depletion_years(
+                0, 100000, 50000, 20, 10, 0.05, 0.08, 0, verbose=False
             )
             
             if zero_corpus_years == 0:
-                print(f"  ✅ Zero corpus correctly depletes immediately")
-                self.test_results.append(("Zero corpus", True, ""))
+                self._log.append(f"  ✅ Zero corpus correctly depletes immediately")
+                self._record("Zero corpus", True, "")
             else:
-                print(f"  ❌ Zero corpus incorrect: got {zero_corpus_years}, expected 0")
-                self.test_results.append(("Zero corpus", False, "Should deplete immediately"))
+                self._log.append(f"  ❌ Zero corpus incorrect: got {zero_corpus_years}, expected 0")
+                self._record("Zero corpus", False, "Should deplete immediately")
                 
         except Exception as e:
-            print(f"  ❌ Zero corpus test failed: {e}")
-            self.test_results.append(("Zero corpus", False, str(e)))
+            self._log.append(f"  ❌ Zero corpus test failed: {e}")
+            self._record("Zero corpus", False, str(e))
         
         # Test 2: NPS pension higher than UPS
-        print("\nTest 2: NPS Pension Higher Than UPS")
+        self._log.append("\nTest 2: NPS Pension Higher Than UPS")
         try:
-            high_nps_years, _ = self.capture_console_output(
-                calculate_corpus_depletion_years,
-                10000000, 50000, 100000, 20, 10, 0.05, 0.08, 0  # NPS higher than UPS
+            high_nps_years = calculate_corpus_depletion_years(
+                10000000, 50000, 100000, 20, 10, 0.05, 0.08, 0, verbose=False  # NPS higher than UPS
             )
             
             if high_nps_years == float('inf'):
-                print(f"  ✅ Higher NPS pension correctly shows infinite corpus life")
-                self.test_results.append(("High NPS pension", True, ""))
+                self._log.append(f"  ✅ Higher NPS pension correctly shows infinite corpus life")
+                self._record("High NPS pension", True, "")
             else:
-                print(f"  ❌ High NPS pension incorrect: got {high_nps_years}, expected inf")
-                self.test_results.append(("High NPS pension", False, "Should be infinite"))
+                self._log.append(f"  ❌ High NPS pension incorrect: got {high_nps_years}, expected inf")
+                self._record("High NPS pension", False, "Should be infinite")
                 
         except Exception as e:
-            print(f"  ❌ High NPS pension test failed: {e}")
-            self.test_results.append(("High NPS pension", False, str(e)))
+            self._log.append(f"  ❌ High NPS pension test failed: {e}")
+            self._record("High NPS pension", False, str(e))
         
         # Test 3: Maximum service years
-        print("\nTest 3: Maximum Service Years (>25)")
+        self._log.append("\nTest 3: Maximum Service Years (>25)")
         try:
             pension_25 = calculate_ups_monthly_pension(6000000, 25)
             pension_30 = calculate_ups_monthly_pension(6000000, 30)
@@ -181,40 +223,41 @@ class IntegrationTester:
             
             # All should be the same (capped at 25 years)
             if abs(pension_25 - pension_30) < self.tolerance and abs(pension_25 - pension_40) < self.tolerance:
-                print(f"  ✅ Service years correctly capped at 25: {format_amount(pension_25)}")
-                self.test_results.append(("Service years cap", True, ""))
+                self._log.append(f"  ✅ Service years correctly capped at 25: {format_amount(pension_25)}")
+                self._record("Service years cap", True, "")
             else:
-                print(f"  ❌ Service years cap failed: 25y={pension_25}, 30y={pension_30}, 40y={pension_40}")
-                self.test_results.append(("Service years cap", False, "Not properly capped"))
+                self._log.append(f"  ❌ Service years cap failed: 25y={pension_25}, 30y={pension_30}, 40y={pension_40}")
+                self._record("Service years cap", False, "Not properly capped")
                 
         except Exception as e:
-            print(f"  ❌ Service years cap test failed: {e}")
-            self.test_results.append(("Service years cap", False, str(e)))
+            self._log.append(f"  ❌ Service years cap test failed: {e}")
+            self._record("Service years cap", False, str(e))
     
+    @_buffered_output
     def test_consistency_checks(self):
         """Test internal consistency of calculations"""
-        print("\n=== Testing Consistency Checks ===")
+        self._log.append("\n=== Testing Consistency Checks ===")
         
         # Test 1: Proportional scaling
-        print("\nTest 1: Proportional Scaling")
+        self._log.append("\nTest 1: Proportional Scaling")
         try:
             base_salary = 3600000
             base_final = calculate_final_salary(base_salary, 0.07, 7)
             double_final = calculate_final_salary(base_salary * 2, 0.07, 7)
             
             if abs(double_final - base_final * 2) < self.tolerance:
-                print(f"  ✅ Final salary scales proportionally")
-                self.test_results.append(("Proportional scaling", True, ""))
+                self._log.append(f"  ✅ Final salary scales proportionally")
+                self._record("Proportional scaling", True, "")
             else:
-                print(f"  ❌ Final salary scaling failed: {double_final} vs {base_final * 2}")
-                self.test_results.append(("Proportional scaling", False, "Not proportional"))
+                self._log.append(f"  ❌ Final salary scaling failed: {double_final} vs {base_final * 2}")
+                self._record("Proportional scaling", False, "Not proportional")
                 
         except Exception as e:
-            print(f"  ❌ Proportional scaling test failed: {e}")
-            self.test_results.append(("Proportional scaling", False, str(e)))
+            self._log.append(f"  ❌ Proportional scaling test failed: {e}")
+            self._record("Proportional scaling", False, str(e))
         
         # Test 2: NPS corpus consistency
-        print("\nTest 2: NPS Corpus Consistency")
+        self._log.append("\nTest 2: NPS Corpus Consistency")
         try:
             # Test that existing corpus grows correctly
             base_corpus = calculate_nps_corpus(3600000, 0.07, 7, 0.24, 0.095, 1000000)
@@ -223,38 +266,191 @@ class IntegrationTester:
             actual_difference = base_corpus - zero_existing
             
             if abs(actual_difference - expected_difference) < 1:  # Allow 1 rupee tolerance for rounding
-                print(f"  ✅ Existing corpus grows correctly")
-                self.test_results.append(("NPS corpus consistency", True, ""))
+                self._log.append(f"  ✅ Existing corpus grows correctly")
+                self._record("NPS corpus consistency", True, "")
+            else:
+                self._log.append(f"  ❌ Existing corpus growth failed: diff={actual_difference}, expected={expected_difference}")
+                self._record("NPS corpus consistency", False, "Incorrect growth")
+                
+        except Exception as e:
+            self._log.append(f"  ❌ NPS corpus consistency test failed: {e}")
+            self._record("NPS corpus consistency", False, str(e))
+    
+        # Test 3: Fast depletion helper agrees with the year-by-year table
+        self._log.append("\nTest 3: Fast Corpus Depletion")
+        try:
+            scenarios = [
+                (8000000, 200000, 50000, 20, 10, 0.05, 0.08, 5000000),   # Both phases with growth
+                (5000000, 200000, 50000, 30, 0, 0.0, 0.08, 0),           # Closed form, depletes
+                (15000000, 200000, 50000, 30, 0, 0.0, 0.08, 0),          # Closed form, never depletes
+                (20000000, 200000, 50000, 30, 0, 0.0, 0.0, 0),           # No return
+                (5000000, 200000, 50000, 30, 0, 0.0, 1e-16, 0),          # Return below machine epsilon
+                (5000000, 200000, 50000, 30, 0, 0.0, 1e-13, 0),          # Negligible return
+                (5000000, 200000, 50000, 10**9, 0, 0.05, 0.08, 0),       # Huge horizon, depletes early
+                (0, 100000, 50000, 20, 10, 0.05, 0.08, 0),               # Zero corpus
+                (10000000, 50000, 100000, 20, 10, 0.05, 0.08, 0),        # Perpetual
+            ]
+            mismatches = []
+            for args in scenarios:
+                expected = calculate_corpus_depletion_years(*args, output_stream=io.StringIO())
+                actual = _depletion_year_fast(*args)
+                if actual != expected:
+                    mismatches.append(f"{args}: got {actual}, expected {expected}")
+            
+            if not mismatches:
+                self._log.append(f"  ✅ Fast depletion matches the yearly table for {len(scenarios)} scenarios")
+                self._record("Fast corpus depletion", True, "")
+            else:
+                for mismatch in mismatches:
+                    self._log.append(f"  ❌ Fast depletion mismatch for {mismatch}")
+                self._record("Fast corpus depletion", False, "; ".join(mismatches))
+                
+        except Exception as e:
+            self._log.append(f"  ❌ Fast corpus depletion test failed: {e}")
+            self._record("Fast corpus depletion", False, str(e))
+    
+        # Test 4: Closed-form NPS corpus agrees with a year-by-year sum
+        self._log.append("\nTest 4: Closed-Form NPS Corpus")
+        try:
+            scenarios = [
+                (3600000, 0.07, 7, 0.24, 0.095, 12000000),
+                (3600000, 0.095, 30, 0.24, 0.095, 0),        # Growth equals return
+                (3600000, 0.0950000001, 30, 0.24, 0.095, 0), # Growth almost equals return
+                (1000000, -0.1, 20, 0.14, 0.08, 500000),
+                (1000000, -1.5, 9, 0.14, 0.08, 500000),      # Non-positive growth factor
+                (1000000, 0.07, 0, 0.24, 0.095, 500000),
+            ]
+            mismatches = []
+            for (salary, growth, years, rate, annual_return, existing) in scenarios:
+                expected = existing * ((1 + annual_return) ** years)
+                for i in range(1, years + 1):
+                    expected += rate * salary * ((1 + growth) ** i) * ((1 + annual_return) ** (years - i))
+                actual = calculate_nps_corpus(salary, growth, years, rate, annual_return, existing)
+                if not math.isclose(actual, expected, rel_tol=1e-12, abs_tol=self.tolerance):
+                    mismatches.append(f"years={years}, growth={growth}: got {actual}, expected {expected}")
+            
+            if not mismatches:
+                self._log.append(f"  ✅ Closed form matches the yearly sum for {len(scenarios)} scenarios")
+                self._record("Closed-form NPS corpus", True, "")
             else:
-                print(f"  ❌ Existing corpus growth failed: diff={actual_difference}, expected={expected_difference}")
-                self.test_results.append(("NPS corpus consistency", False, "Incorrect growth"))
+                for mismatch in mismatches:
+                    self._log.append(f"  ❌ Closed-form corpus mismatch for {mismatch}")
+                self._record("Closed-form NPS corpus", False, "; ".join(mismatches))
                 
         except Exception as e:
-            print(f"  ❌ NPS corpus consistency test failed: {e}")
-            self.test_results.append(("NPS corpus consistency", False, str(e)))
+            self._log.append(f"  ❌ Closed-form NPS corpus test failed: {e}")
+            self._record("Closed-form NPS corpus", False, str(e))
+        
+        # Test 5: NumPy batch calculators agree with the scalar functions
+        self._log.append("\nTest 5: NumPy Batch Calculators")
+        try:
+            import numpy as np
+            import upsnpscalculator_numpy as batch
+        except ImportError:
+            batch = None
+        if batch is None:
+            self._log.append("  ℹ️  NumPy is not installed, skipping batch calculators")
+            self._record("NumPy batch calculators", True, "Skipped (NumPy not installed)")
+        else:
+            try:
+                scenarios = [
+                    (3600000, 0.07, 7, 0.24, 0.095, 12000000),
+                    (3600000, 0.0, 0, 0.24, 0.095, 0),
+                    (100000, 0.05, 35, 0.24, 0.05, 0),  # Growth equals return
+                    (10000000, -0.1, 15, 0.14, 0.08, 500000),
+                    (3600000, 0.07, -1, 0.24, 0.095, 12000000),
+                ]
+                columns = list(zip(*scenarios))
+                corpora = batch.calculate_nps_corpus_batch(*columns)
+                salaries = batch.calculate_final_salary_batch(*columns[:3])
+                mismatches = [
+                    str(args) for args, corpus, salary in zip(scenarios, corpora, salaries)
+                    if abs(corpus - calculate_nps_corpus(*args)) > self.tolerance
+                    or abs(salary - calculate_final_salary(*args[:3])) > self.tolerance
+                    or abs(batch.nps_contribution_schedule(*args[:5]).sum()
+                           - calculate_nps_corpus(*args[:5], 0)) > self.tolerance
+                ]
+                depletion_scenarios = [
+                    (7000000, 100000, 50000, 20, 10, 0.05, 0.08, 1000000),
+                    (7000000, 100000, 50000, 20, 10, 0.0, 0.08, 0.0),
+                    (1000000, 100000, 0, -2, 15, 0.03, 0.06, 0.0),  # Spouse phase only
+                    (50000000, 100000, 0, 20, 10, 0.05, 0.15, 0.0),  # Never depletes
+                    (0, 100000, 50000, 20, 10, 0.05, 0.08, 0.0),
+                ]
+                depletion_years = batch.calculate_corpus_depletion_years_batch(*zip(*depletion_scenarios))
+                if not (batch.sweep_depletion(depletion_scenarios, chunk_size=2) == depletion_years).all():
+                    mismatches.append("sweep_depletion")
+                # The cached scalar functions still accept NumPy arrays
+                salaries_array = np.array([3600000.0, 100000.0])
+                if not np.array_equal(calculate_final_salary(salaries_array, 0.07, 7),
+                                      batch.calculate_final_salary_batch(salaries_array, 0.07, 7)):
+                    mismatches.append("calculate_final_salary(np.ndarray)")
+                # Batch results are NumPy scalars; they must format like Python numbers
+                for amount in (corpora[0], np.int64(150000), np.float32(500)):
+                    if format_amount(amount) != format_amount(float(amount)):
+                        mismatches.append(f"format_amount({amount!r})")
+                mismatches += [
+                    str(args) for args, years in zip(depletion_scenarios, depletion_years)
+                    if years != calculate_corpus_depletion_years(*args, verbose=False)
+                ]
+                
+                if not mismatches:
+                    self._log.append(f"  ✅ Batch results match the scalar functions for {len(scenarios) + len(depletion_scenarios)} scenarios")
+                    self._record("NumPy batch calculators", True, "")
+                else:
+                    self._log.append(f"  ❌ Batch results differ for: {', '.join(mismatches)}")
+                    self._record("NumPy batch calculators", False, "; ".join(mismatches))
+                    
+            except Exception as e:
+                self._log.append(f"  ❌ NumPy batch calculator test failed: {e}")
+                self._record("NumPy batch calculators", False, str(e))
     
+        # Test 6: Bundled calculators match the individual functions
+        self._log.append("\nTest 6: Bundled UPS and NPS Calculators")
+        try:
+            final_salary = calculate_final_salary(3600000, 0.07, 7)
+            expected_ups = (final_salary, calculate_ups_monthly_pension(final_salary, 32),
+                            calculate_ups_lump_sum(final_salary, 32))
+            corpus = calculate_nps_corpus(3600000, 0.07, 7, 0.24, 0.095, 12000000)
+            expected_nps = (corpus, calculate_nps_monthly_pension(corpus, 0.07), corpus * 0.6)
+            ups_bundle = calculate_ups_bundle(3600000, 0.07, 7, 32)
+            nps_bundle = calculate_nps_bundle(3600000, 0.07, 7, 0.24, 0.095, 12000000, 0.07)
+            
+            if (all(abs(a - b) < self.tolerance for a, b in zip(ups_bundle, expected_ups))
+                    and all(abs(a - b) < self.tolerance for a, b in zip(nps_bundle, expected_nps))):
+                self._log.append(f"  ✅ Bundled results match the individual calculators")
+                self._record("Bundled calculators", True, "")
+            else:
+                self._log.append(f"  ❌ Bundled results differ: UPS {ups_bundle} vs {expected_ups}, NPS {nps_bundle} vs {expected_nps}")
+                self._record("Bundled calculators", False, "Results differ")
+                
+        except Exception as e:
+            self._log.append(f"  ❌ Bundled calculator test failed: {e}")
+            self._record("Bundled calculators", False, str(e))
+    
+    @_buffered_output
     def test_error_handling(self):
         """Test error handling for invalid inputs"""
-        print("\n=== Testing Error Handling ===")
+        self._log.append("\n=== Testing Error Handling ===")
         
         # Test 1: Negative inputs
-        print("\nTest 1: Handling Negative Inputs")
+        self._log.append("\nTest 1: Handling Negative Inputs")
         try:
             # These should still calculate but may give unexpected results
             neg_salary_result = calculate_final_salary(-1000000, 0.07, 5)
             neg_growth_result = calculate_final_salary(1000000, -0.1, 5)
             
-            print(f"  ℹ️  Negative salary result: {neg_salary_result}")
-            print(f"  ℹ️  Negative growth result: {neg_growth_result}")
-            print(f"  ✅ Functions handle negative inputs (may produce negative results)")
-            self.test_results.append(("Negative inputs", True, "Handled gracefully"))
+            self._log.append(f"  ℹ️  Negative salary result: {neg_salary_result}")
+            self._log.append(f"  ℹ️  Negative growth result: {neg_growth_result}")
+            self._log.append(f"  ✅ Functions handle negative inputs (may produce negative results)")
+            self._record("Negative inputs", True, "Handled gracefully")
             
         except Exception as e:
-            print(f"  ❌ Negative input handling failed: {e}")
-            self.test_results.append(("Negative inputs", False, str(e)))
+            self._log.append(f"  ❌ Negative input handling failed: {e}")
+            self._record("Negative inputs", False, str(e))
         
         # Test 2: Zero values
-        print("\nTest 2: Handling Zero Values")
+        self._log.append("\nTest 2: Handling Zero Values")
         try:
             zero_tests = [
                 ("Zero salary", calculate_final_salary, [0, 0.07, 5]),
@@ -266,13 +462,13 @@ class IntegrationTester:
             
             for test_name, func, args in zero_tests:
                 result = func(*args)
-                print(f"  ✅ {test_name}: {result}")
+                self._log.append(f"  ✅ {test_name}: {result}")
             
-            self.test_results.append(("Zero values", True, "All handled"))
+            self._record("Zero values", True, "All handled")
             
         except Exception as e:
-            print(f"  ❌ Zero value handling failed: {e}")
-            self.test_results.append(("Zero values", False, str(e)))
+            self._log.append(f"  ❌ Zero value handling failed: {e}")
+            self._record("Zero values", False, str(e))
     
     def run_all_tests(self):
         """Run all integration tests"""
@@ -285,8 +481,8 @@ class IntegrationTester:
         self.test_error_handling()
         
         # Print summary
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for _, passed, _ in self.test_results if passed)
+        total_tests = len(self.passed)
+        passed_tests = sum(self.passed)
         failed_tests = total_tests - passed_tests
         
         print(f"\n{'=' * 60}")
@@ -300,19 +496,40 @@ class IntegrationTester:
         if failed_tests > 0:
             print(f"\nFAILED TESTS:")
             print("-" * 30)
-            for test_name, passed, error_msg in self.test_results:
+            for test_name, passed, error_msg in zip(self.names, self.passed, self.errors):
                 if not passed:
                     print(f"❌ {test_name}: {error_msg}")
         
         return failed_tests == 0
 
+# pytest entry points: each runs one group of checks in-process and fails
+# with the messages of the checks that did not pass
+def _assert_checks_pass(method_name: str) -> None:
+    tester = IntegrationTester()
+    getattr(tester, method_name)()
+    failures = [f"{test_name}: {error_msg}"
+                for test_name, passed, error_msg in zip(tester.names, tester.passed, tester.errors)
+                if not passed]
+    assert not failures, "; ".join(failures)
+
+def test_complete_calculation_workflow():
+    _assert_checks_pass('test_complete_calculation_workflow')
+
+def test_edge_cases():
+    _assert_checks_pass('test_edge_cases')
+
+def test_consistency_checks():
+    _assert_checks_pass('test_consistency_checks')
+
+def test_error_handling():
+    _assert_checks_pass('test_error_handling')
+
 def main():
     """Main test runner"""
     print("Starting UPS vs NPS Calculator Integration Tests...")
     
     # Check if the calculator files exist
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    py_calc = os.path.join(script_dir, 'upsnpscalculator.py')
+    py_calc = os.path.join(SCRIPT_DIR, 'upsnpscalculator.py')
     
     if not os.path.exists(py_calc):
         print(f"❌ Error: Python calculator not found at {py_calc}")
@@ -157,13 +157,31 @@ function calculateNPSCorpus(currentSalary, growthRate, years, totalContribRate,
      * @returns {number} Total corpus accumulated at retirement
      */
     let corpus = existingCorpus * Math.pow(1 + annualReturn, years);
+    if (years <= 0) {
+        return corpus;
+    }
     
-    for (let i = 1; i <= years; i++) {
-        const salaryAtYear = currentSalary * Math.pow(1 + growthRate, i);
-        const annualContribution = totalContribRate * salaryAtYear;
-        const yearsToCompound = years - i;
-        corpus += annualContribution * Math.pow(1 + annualReturn, yearsToCompound);
+    // Contributions form a geometric series: the sum over i = 1..years of
+    // g**i * r**(years - i) equals g * r**(years - 1) * (1 - q**years) / (1 - q)
+    // with q = g / r. Writing the ratio with expm1 keeps it accurate when
+    // salary growth is close to the return. Same formula as the Python version.
+    const g = 1 + growthRate;
+    const r = 1 + annualReturn;
+    let series;
+    if (g > 0 && r > 0) {
+        const logQ = Math.log(g / r);
+        const ratio = logQ ? Math.expm1(years * logQ) / Math.expm1(logQ) : years;
+        series = g * Math.pow(r, years - 1) * ratio;
+    } else {
+        // Horner's scheme with a running power of g
+        series = 0.0;
+        let growthPower = 1.0;
+        for (let i = 0; i < years; i++) {
+            growthPower *= g;
+            series = series * r + growthPower;
+        }
     }
+    corpus += totalContribRate * currentSalary * series;
     return corpus;
 }
 
@@ -1,7 +1,11 @@
 # Copyright (C) 2025 Yogesh Wadadekar
 # This program is licensed under GPL v3. See LICENSE file for details.
 
-from typing import Union
+import argparse
+import functools
+import math
+import sys
+from typing import List, Optional, TextIO, Tuple, Union
 
 # --- Constants ---
 UPS_PENSION_FACTOR: float = 0.5
@@ -10,6 +14,28 @@ NPS_ANNUITY_PORTION: float = 0.4
 NPS_LUMP_SUM_PORTION: float = 0.6
 MONTHS_PER_YEAR: int = 12
 
+def _cached(func):
+    """
+    Memoize a pure calculator with lru_cache, keyed by argument values and types.
+    
+    Unhashable arguments such as NumPy arrays cannot be cache keys, so those
+    calls run the function uncached instead of raising TypeError.
+    """
+    cached_func = functools.lru_cache(maxsize=4096, typed=True)(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return cached_func(*args, **kwargs)
+        except TypeError:
+            # Unhashable arguments; a TypeError from the calculator itself is raised again here
+            return func(*args, **kwargs)
+    
+    wrapper.cache_info = cached_func.cache_info
+    wrapper.cache_clear = cached_func.cache_clear
+    return wrapper
+
+@_cached
 def calculate_final_salary(current_salary: float, growth_rate: float, years: int) -> float:
     """
     Calculate the final basic salary at retirement based on compound growth.
@@ -24,6 +50,7 @@ def calculate_final_salary(current_salary: float, growth_rate: float, years: int
     """
     return current_salary * ((1 + growth_rate) ** years)
 
+@_cached
 def calculate_ups_monthly_pension(final_salary: float, years_of_service: int) -> float:
     """
     Calculate the monthly pension under UPS, proportionate to years of service.
@@ -39,6 +66,7 @@ def calculate_ups_monthly_pension(final_salary: float, years_of_service: int) ->
     annual_pension: float = employee_factor * final_salary
     return annual_pension / MONTHS_PER_YEAR
 
+@_cached
 def calculate_ups_lump_sum(final_salary_annual: float, years_of_service: int) -> float:
     """
     Calculate the lump sum payment under UPS.
@@ -63,11 +91,117 @@ def format_amount(amount: float) -> str:
     """
     Format amount to show in lakhs if >= 1 lakh, otherwise in thousands
     """
-    if amount >= 100000:
-        return f"{amount/100000:.2f}L"
-    elif amount >= 1000:
-        return f"{amount/1000:.2f}K"
-    return f"{amount:.2f}"
+    # 0.0 and -0.0 would share a cache entry but format differently
+    if amount == 0:
+        return f"{amount:.2f}"
+    return _format_amount_cached(amount)
+
+# (divisor, suffix) indexed by how many of the thousand/lakh thresholds an amount reaches
+_AMOUNT_UNITS = ((1, ""), (1000, "K"), (100000, "L"))
+
+@functools.lru_cache(maxsize=8192)
+def _format_amount_cached(amount: float) -> str:
+    """Format a non-zero amount; repeated amounts are served from the cache"""
+    divisor, suffix = _AMOUNT_UNITS[int(amount >= 1000) + int(amount >= 100000)]
+    return f"{amount/divisor:.2f}{suffix}"
+
+# Table label for each phase, indexed by the spouse-phase flag
+_PHASE_LABELS = ("Employee", "Spouse")
+
+# One row of the year-by-year table: the year, eight formatted amounts and the phase label
+_ROW_FMT = "{:4d}  {:>10}  {:>10}  {:>10}  {:>11}  {:>10}  {:>10}  {:>13}  {:>14}  {:>7}"
+
+def _never_depletes(
+    initial_corpus: float,
+    ups_monthly_initial: float,
+    nps_monthly: float,
+    employee_life_years: int,
+    spouse_additional_years: int,
+    corpus_return: float,
+    ups_lump_sum: float
+) -> bool:
+    """
+    Check up front whether the corpus lasts forever.
+    
+    The corpus never depletes when, in the first simulated year, the NPS annuity plus the
+    return on the corpus covers the UPS pension plus the return on the UPS lump sum.
+    An empty corpus or an empty horizon is never simulated, so it does not count.
+    """
+    if initial_corpus <= 0 or employee_life_years + spouse_additional_years <= 0:
+        return False
+    first_factor: float = UPS_SPOUSE_FACTOR if employee_life_years <= 0 else 1.0
+    total_ups_income: float = ups_monthly_initial * first_factor * MONTHS_PER_YEAR + ups_lump_sum * corpus_return
+    total_nps_income: float = nps_monthly * MONTHS_PER_YEAR + initial_corpus * corpus_return
+    return total_nps_income >= total_ups_income
+
+def _phase_schedule(employee_life_years: int, total_years: int) -> Tuple[Tuple[bool, float, int], ...]:
+    """
+    Split the simulated years into the employee phase and the spouse phase.
+    
+    Returns:
+      Tuple of (spouse phase, UPS pension factor, end year) for each phase in order,
+      so the yearly loops can run once per phase with the factor held constant.
+    """
+    total_years = max(total_years, 0)
+    employee_years: int = min(max(employee_life_years, 0), total_years)
+    return (False, 1.0, employee_years), (True, UPS_SPOUSE_FACTOR, total_years)
+
+def _simulate_depletion(
+    initial_corpus: float,
+    ups_monthly_initial: float,
+    nps_monthly: float,
+    employee_life_years: int,
+    spouse_additional_years: int,
+    post_ret_growth: float,
+    corpus_return: float,
+    ups_lump_sum: float
+) -> Tuple[List[Tuple[int, float, float, float, float, float, float, float, float, bool]], Union[int, float], float]:
+    """
+    Run the year-by-year corpus simulation without any formatting or printing.
+    
+    Returns:
+      Tuple of the yearly rows (year, yearly UPS, UPS return, total UPS, yearly NPS,
+      NPS return, total NPS, difference, corpus balance, spouse phase), the number of
+      years the corpus lasts (or float('inf')) and the final corpus balance.
+      A corpus that never depletes is detected before the loop, so it has no rows.
+    """
+    # Perpetual check: if NPS annuity + NPS corpus return >= UPS pension + UPS lump sum return, corpus will never deplete
+    if _never_depletes(initial_corpus, ups_monthly_initial, nps_monthly, employee_life_years,
+                       spouse_additional_years, corpus_return, ups_lump_sum):
+        return [], float('inf'), initial_corpus
+
+    corpus: float = initial_corpus
+    year: int = 0
+    ups_monthly: float = ups_monthly_initial
+    total_years: int = employee_life_years + spouse_additional_years
+    rows: List[Tuple[int, float, float, float, float, float, float, float, float, bool]] = []
+    yearly_nps: float = nps_monthly * MONTHS_PER_YEAR # Calculate constant NPS yearly amount once
+    ups_return: float = ups_lump_sum * corpus_return
+    corpus_growth: float = 1 + corpus_return
+    ups_growth: float = 1 + post_ret_growth
+    months: int = MONTHS_PER_YEAR
+    for is_spouse_phase, ups_factor, phase_end in _phase_schedule(employee_life_years, total_years):
+        while corpus > 0 and year < phase_end:
+            current_ups: float = ups_monthly * ups_factor
+
+            yearly_ups: float = current_ups * months
+            total_ups_income: float = yearly_ups + ups_return
+            nps_return: float = corpus * corpus_return
+            total_nps_income: float = yearly_nps + nps_return
+            yearly_difference: float = total_ups_income - total_nps_income
+
+            rows.append((year, yearly_ups, ups_return, total_ups_income, yearly_nps, nps_return,
+                         total_nps_income, yearly_difference, corpus, is_spouse_phase))
+
+            # Correct corpus update: corpus grows by post-tax return, then is reduced by (UPS+UPS return)-(NPS+NPS return) if UPS+UPS return > NPS+NPS return
+            if yearly_difference > 0:
+                corpus -= yearly_difference
+            corpus = corpus * corpus_growth
+
+            ups_monthly *= ups_growth
+            year += 1
+
+    return rows, year, corpus
 
 def calculate_corpus_depletion_years(
     initial_corpus: float,
@@ -77,7 +211,9 @@ def calculate_corpus_depletion_years(
     spouse_additional_years: int,
     post_ret_growth: float = 0.05,
     corpus_return: float = 0.08,
-    ups_lump_sum: float = 0.0
+    ups_lump_sum: float = 0.0,
+    verbose: bool = True,
+    output_stream: Optional[TextIO] = None
 ) -> Union[int, float]:
     """
     Calculate how many years the NPS lump sum corpus will last while covering pension differences.
@@ -91,57 +227,119 @@ def calculate_corpus_depletion_years(
         post_ret_growth (float): Annual growth rate of UPS pension.
         corpus_return (float): Annual return on remaining corpus.
         ups_lump_sum (float): UPS lump sum corpus invested to earn returns.
+        verbose (bool): Print the year-by-year table; when False nothing is printed.
+        output_stream (TextIO): Where to write the table (defaults to sys.stdout).
     Returns:
       Union[int, float]: Number of years the corpus lasts, or float('inf') if it never depletes.
     """
-    corpus: float = initial_corpus
-    year: int = 0
-    ups_monthly: float = ups_monthly_initial
-    total_years: int = employee_life_years + spouse_additional_years
-    yearly_nps: float = nps_monthly * MONTHS_PER_YEAR # Calculate constant NPS yearly amount once
-    
-    print("\nYear-by-year Corpus Analysis with Returns:")
-    print("Year  UPS Pension  UPS Return  Total UPS   NPS Annuity  NPS Return  Total NPS   Diff(UPS-NPS)  Corpus Balance  Phase")
-    print("-" * 120)
-    
-    post_tax_corpus_return = corpus_return
-
-    while corpus > 0 and year < total_years:
-        is_spouse_phase: bool = year >= employee_life_years
-        current_ups: float = ups_monthly * (UPS_SPOUSE_FACTOR if is_spouse_phase else 1.0)
-        phase: str = "Spouse" if is_spouse_phase else "Employee"
-
-        yearly_ups: float = current_ups * MONTHS_PER_YEAR
-        ups_return: float = ups_lump_sum * post_tax_corpus_return
-        total_ups_income: float = yearly_ups + ups_return
-        nps_return: float = corpus * post_tax_corpus_return
-        yearly_nps: float = nps_monthly * MONTHS_PER_YEAR
-        total_nps_income: float = yearly_nps + nps_return
-        yearly_difference: float = total_ups_income - total_nps_income
-
-        print(
-            f"{year:4d}  {format_amount(yearly_ups):>10}  {format_amount(ups_return):>10}  {format_amount(total_ups_income):>10}  "
-            f"{format_amount(yearly_nps):>11}  {format_amount(nps_return):>10}  {format_amount(total_nps_income):>10}  "
-            f"{format_amount(yearly_difference):>13}  {format_amount(corpus):>14}  {phase:>7}"
+    if not verbose:
+        return _depletion_year_fast(
+            initial_corpus, ups_monthly_initial, nps_monthly, employee_life_years,
+            spouse_additional_years, post_ret_growth, corpus_return, ups_lump_sum
         )
-
-        # Correct corpus update: corpus grows by post-tax return, then is reduced by (UPS+UPS return)-(NPS+NPS return) if UPS+UPS return > NPS+NPS return
-        corpus -= max(0, total_ups_income - total_nps_income)
-        corpus = corpus * (1 + post_tax_corpus_return)
-
-        # Perpetual check: if NPS annuity + NPS corpus return >= UPS pension + UPS lump sum return, corpus will never deplete
-        if year == 0 and total_nps_income >= total_ups_income:
-            print("\nThe corpus will never deplete as the post-tax investment returns and NPS annuity cover the UPS pension plus UPS lump sum returns perpetually!")
-            return float('inf')
-
-        ups_monthly *= (1 + post_ret_growth)
-        year += 1
+    
+    if output_stream is None:
+        output_stream = sys.stdout
+    
+    rows, years, corpus = _simulate_depletion(
+        initial_corpus, ups_monthly_initial, nps_monthly, employee_life_years,
+        spouse_additional_years, post_ret_growth, corpus_return, ups_lump_sum
+    )
+    
+    if years == float('inf'):
+        output_stream.write("\nThe corpus will never deplete as the post-tax investment returns and NPS annuity cover the UPS pension plus UPS lump sum returns perpetually!\n")
+        return years
+    
+    # Build the whole table in one pass and write it at once
+    lines: List[str] = [
+        "\nYear-by-year Corpus Analysis with Returns:",
+        "Year  UPS Pension  UPS Return  Total UPS   NPS Annuity  NPS Return  Total NPS   Diff(UPS-NPS)  Corpus Balance  Phase",
+        "-" * 120,
+    ]
+    # Local names for the per-row calls
+    fmt = format_amount
+    format_row = _ROW_FMT.format
+    lines += [
+        format_row(year, fmt(yearly_ups), fmt(ups_return), fmt(total_ups_income),
+                   fmt(yearly_nps), fmt(nps_return), fmt(total_nps_income),
+                   fmt(yearly_difference), fmt(balance), _PHASE_LABELS[is_spouse_phase])
+        for (year, yearly_ups, ups_return, total_ups_income, yearly_nps, nps_return,
+             total_nps_income, yearly_difference, balance, is_spouse_phase) in rows
+    ]
     
     if corpus <= 0:
-        print(f"\nThe corpus is depleted after {year} years.")
+        lines.append(f"\nThe corpus is depleted after {years} years.")
     
+    output_stream.write("\n".join(lines) + "\n")
+    return years
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _depletion_year_fast(
+    initial_corpus: float,
+    ups_monthly_initial: float,
+    nps_monthly: float,
+    employee_life_years: int,
+    spouse_additional_years: int,
+    post_ret_growth: float = 0.05,
+    corpus_return: float = 0.08,
+    ups_lump_sum: float = 0.0
+) -> Union[int, float]:
+    """
+    Return the same result as calculate_corpus_depletion_years without printing the yearly table.
+    
+    While the yearly difference stays positive the corpus follows the linear
+    recurrence corpus' = (1 + r) * ((1 + r) * corpus - K), where
+    K = yearly UPS pension + UPS lump sum return - yearly NPS annuity.
+    When K is constant (no UPS growth and a single phase) the corpus moves
+    away from the fixed point c* = (1 + r) * K / ((1 + r)**2 - 1), so a corpus
+    below c* reaches zero after ceil(log(c* / (c* - corpus)) / (2 * log(1 + r)))
+    years and a corpus at or above it never does. Other inputs, including returns
+    below 1e-9, are simulated year by year.
+    """
+    total_years: int = employee_life_years + spouse_additional_years
+    if initial_corpus <= 0 or total_years <= 0:
+        return 0
+    
+    if _never_depletes(initial_corpus, ups_monthly_initial, nps_monthly, employee_life_years,
+                       spouse_additional_years, corpus_return, ups_lump_sum):
+        return float('inf')
+    
+    ups_return: float = ups_lump_sum * corpus_return
+    yearly_nps: float = nps_monthly * MONTHS_PER_YEAR
+    
+    single_phase: bool = spouse_additional_years <= 0 or employee_life_years <= 0
+    # A negligible return is simulated instead: the loop multiplies by the rounded
+    # 1 + r, which the closed form cannot reproduce once r nears machine epsilon
+    if post_ret_growth == 0 and single_phase and corpus_return >= 1e-9:
+        growth: float = 1 + corpus_return
+        log_growth: float = math.log1p(corpus_return)
+        first_factor: float = UPS_SPOUSE_FACTOR if employee_life_years <= 0 else 1.0
+        yearly_gap: float = ups_monthly_initial * first_factor * MONTHS_PER_YEAR + ups_return - yearly_nps
+        fixed_point: float = growth * yearly_gap / math.expm1(2 * log_growth)
+        if initial_corpus >= fixed_point:
+            return total_years
+        years: int = math.ceil(math.log(fixed_point / (fixed_point - initial_corpus))
+                               / (2 * log_growth))
+        return min(max(years, 1), total_years)
+    
+    corpus: float = initial_corpus
+    year: int = 0
+    ups_monthly: float = ups_monthly_initial
+    corpus_growth: float = 1 + corpus_return
+    ups_growth: float = 1 + post_ret_growth
+    months: int = MONTHS_PER_YEAR
+    for _, ups_factor, phase_end in _phase_schedule(employee_life_years, total_years):
+        while corpus > 0 and year < phase_end:
+            yearly_difference: float = ((ups_monthly * ups_factor * months + ups_return)
+                                        - (yearly_nps + corpus * corpus_return))
+            if yearly_difference > 0:
+                corpus -= yearly_difference
+            corpus = corpus * corpus_growth
+            ups_monthly *= ups_growth
+            year += 1
     return year
 
+@_cached
 def calculate_nps_corpus(current_salary: float, growth_rate: float, years: int, 
                          total_contrib_rate: float, annual_return: float, 
                          existing_corpus: float = 0.0) -> float:
@@ -162,14 +360,30 @@ def calculate_nps_corpus(current_salary: float, growth_rate: float, years: int,
       float: Total corpus accumulated at retirement.
     """
     corpus: float = existing_corpus * ((1 + annual_return) ** years)
+    if years <= 0:
+        return corpus
     
-    for i in range(1, years + 1):
-        salary_at_year: float = current_salary * ((1 + growth_rate) ** i)
-        annual_contribution: float = total_contrib_rate * salary_at_year
-        years_to_compound: int = years - i
-        corpus += annual_contribution * ((1 + annual_return) ** years_to_compound)
+    # Contributions form a geometric series: the sum over i = 1..years of
+    # g**i * r**(years - i) equals g * r**(years - 1) * (1 - q**years) / (1 - q)
+    # with q = g / r. Writing the ratio with expm1 keeps it accurate when
+    # salary growth is close to the return.
+    g: float = 1 + growth_rate
+    r: float = 1 + annual_return
+    if g > 0 and r > 0:
+        log_q: float = math.log(g / r)
+        ratio: float = math.expm1(years * log_q) / math.expm1(log_q) if log_q else years
+        series: float = g * (r ** (years - 1)) * ratio
+    else:
+        # Horner's scheme with a running power of g: no pow() per year
+        series = 0.0
+        growth_power: float = 1.0
+        for _ in range(years):
+            growth_power *= g
+            series = series * r + growth_power
+    corpus += total_contrib_rate * current_salary * series
     return corpus
 
+@_cached
 def calculate_nps_monthly_pension(corpus: float, annuity_rate: float) -> float:
     """
     Calculate the estimated monthly pension from NPS.
@@ -186,9 +400,98 @@ def calculate_nps_monthly_pension(corpus: float, annuity_rate: float) -> float:
     annual_annuity_pension: float = NPS_ANNUITY_PORTION * corpus * annuity_rate
     return annual_annuity_pension / MONTHS_PER_YEAR
 
-def main():
-    print("Pension Scheme Comparison: UPS vs NPS")
-    print("-------------------------------------")
+def calculate_ups_bundle(current_salary: float, growth_rate: float, years: int,
+                         years_of_service: int) -> Tuple[float, float, float]:
+    """
+    Calculate the final salary, UPS monthly pension and UPS lump sum in one call.
+    
+    The pension and lump sum are computed by calculate_ups_monthly_pension and
+    calculate_ups_lump_sum from the same final salary.
+    
+    Parameters:
+      current_salary (float): Current basic salary.
+      growth_rate (float): Expected annual salary growth rate.
+      years (int): Number of years until retirement.
+      years_of_service (int): Number of completed years of qualifying service.
+    
+    Returns:
+      Tuple[float, float, float]: Final salary, monthly UPS pension and UPS lump sum.
+    """
+    final_salary: float = calculate_final_salary(current_salary, growth_rate, years)
+    return (final_salary,
+            calculate_ups_monthly_pension(final_salary, years_of_service),
+            calculate_ups_lump_sum(final_salary, years_of_service))
+
+def calculate_nps_bundle(current_salary: float, growth_rate: float, years: int,
+                         total_contrib_rate: float, annual_return: float,
+                         existing_corpus: float, annuity_rate: float) -> Tuple[float, float, float]:
+    """
+    Calculate the NPS corpus, monthly NPS pension and NPS lump sum in one call.
+    
+    The pension comes from calculate_nps_monthly_pension; the lump sum is the
+    NPS_LUMP_SUM_PORTION of the corpus.
+    
+    Parameters:
+      current_salary (float): Current basic salary.
+      growth_rate (float): Annual salary growth rate.
+      years (int): Number of years of contributions.
+      total_contrib_rate (float): Total contribution rate (employee + employer).
+      annual_return (float): Expected annual return on contributions.
+      existing_corpus (float): Already accumulated NPS corpus.
+      annuity_rate (float): The annuity conversion rate (annual) without return of purchase price.
+    
+    Returns:
+      Tuple[float, float, float]: Corpus, monthly NPS pension and NPS lump sum.
+    """
+    corpus: float = calculate_nps_corpus(current_salary, growth_rate, years,
+                                         total_contrib_rate, annual_return, existing_corpus)
+    return (corpus,
+            calculate_nps_monthly_pension(corpus, annuity_rate),
+            corpus * NPS_LUMP_SUM_PORTION)
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser; every option defaults to the interactive prompt's default.
+    """
+    parser = argparse.ArgumentParser(
+        description="Pension Scheme Comparison: UPS vs NPS. Without arguments, the inputs are "
+                    "prompted for interactively when run from a terminal."
+    )
+    parser.add_argument('--current-age', type=int, default=53, help='Current age [53]')
+    parser.add_argument('--retirement-age', type=int, default=60, help='Expected retirement age [60]')
+    parser.add_argument('--current-salary', type=float, default=36.0,
+                        help='Current (Basic + DA) annual amount in lakhs [36.00]')
+    parser.add_argument('--growth-rate', type=float, default=0.07,
+                        help='Expected annual salary growth rate [0.07 for 7%%]')
+    parser.add_argument('--existing-corpus', type=float, default=120.0,
+                        help='Current NPS corpus amount in lakhs [120.00]')
+    parser.add_argument('--employee-rate', type=float, default=0.10,
+                        help='Your NPS contribution rate [0.10 for 10%%]')
+    parser.add_argument('--employer-rate', type=float, default=0.14,
+                        help="Employer's NPS contribution rate [0.14 for 14%%]")
+    parser.add_argument('--annual-return', type=float, default=0.095,
+                        help='Expected annual return on NPS contributions [0.095 for 9.5%%]')
+    parser.add_argument('--annuity-rate', type=float, default=0.07,
+                        help='Annuity conversion rate at retirement without return of purchase price [0.07 for 7%%]')
+    parser.add_argument('--post-ret-growth', type=float, default=0.05,
+                        help='Expected post-retirement UPS pension growth rate [0.05 for 5%%]')
+    parser.add_argument('--corpus-return', type=float, default=0.08,
+                        help='Expected return on remaining NPS corpus post-retirement [0.08 for 8%%]')
+    parser.add_argument('--employee-life-years', type=int, default=20,
+                        help='Expected years of life after retirement [20]')
+    parser.add_argument('--spouse-additional-years', type=int, default=10,
+                        help="Additional years spouse may live after employee's death [10]")
+    parser.add_argument('--join-age', type=int, default=28,
+                        help='Age when you joined Government service [28]')
+    return parser
+
+def _prompt_inputs() -> Optional[argparse.Namespace]:
+    """
+    Ask for each input in turn, using the default when the user just hits enter.
+    
+    Returns:
+      argparse.Namespace: The same fields as the command line options, or None on invalid input.
+    """
     print("Hit enter to use default values in [brackets]")
     
     # User inputs with defaults
@@ -200,13 +503,13 @@ def main():
         retirement_age = 60 if retirement_age_input == "" else int(retirement_age_input)
         
         current_salary_input = input("Enter your current (Basic + DA) annual amount in lakhs [36.00]: ")
-        current_salary = 3600000 if current_salary_input == "" else float(current_salary_input) * 100000
+        current_salary = 36.0 if current_salary_input == "" else float(current_salary_input)
         
         growth_rate_input = input("Enter expected annual salary growth rate [0.07 for 7%]: ")
         growth_rate = 0.07 if growth_rate_input == "" else float(growth_rate_input)
         
         existing_corpus_input = input("Enter your current NPS corpus amount in lakhs [120.00]: ")
-        existing_corpus = 12000000 if existing_corpus_input == "" else float(existing_corpus_input) * 100000
+        existing_corpus = 120.0 if existing_corpus_input == "" else float(existing_corpus_input)
         
         print("\nFor NPS, specify contribution rates:")
         employee_rate_input = input("  Enter your contribution rate [0.10 for 10%]: ")
@@ -214,7 +517,6 @@ def main():
         
         employer_rate_input = input("  Enter employer's contribution rate [0.14 for 14%]: ")
         employer_rate = 0.14 if employer_rate_input == "" else float(employer_rate_input)
-        total_contrib_rate = employee_rate + employer_rate
         
         annual_return_input = input("Enter expected annual return on NPS contributions [0.095 for 9.5%]: ")
         annual_return = 0.095 if annual_return_input == "" else float(annual_return_input)
@@ -234,63 +536,108 @@ def main():
         spouse_additional_input = input("Enter additional years spouse may live after employee's death [10]: ")
         spouse_additional_years = 10 if spouse_additional_input == "" else int(spouse_additional_input)
         
-        # Ask age when the user joined government service and compute service years
+        # Ask age when the user joined government service
         join_age_input = input("Enter your age when you joined Government service [28]: ")
         join_age = 28 if join_age_input == "" else int(join_age_input)
-        years_of_service = retirement_age - join_age
-        if years_of_service < 0:
-            print("Join age must be less than or equal to retirement age.")
-            return
 
         # Tax rate input removed; all returns are now pre-tax
         
     except ValueError:
         print("Invalid input. Please enter numeric values.")
+        return None
+    except EOFError:
+        print("\nInput ended before all values were entered. Pass the inputs as options instead (see --help).")
+        return None
+    
+    return argparse.Namespace(
+        current_age=current_age, retirement_age=retirement_age, current_salary=current_salary,
+        growth_rate=growth_rate, existing_corpus=existing_corpus, employee_rate=employee_rate,
+        employer_rate=employer_rate, annual_return=annual_return, annuity_rate=annuity_rate,
+        post_ret_growth=post_ret_growth, corpus_return=corpus_return,
+        employee_life_years=employee_life_years, spouse_additional_years=spouse_additional_years,
+        join_age=join_age
+    )
+
+def main(argv: Optional[List[str]] = None, output_stream: Optional[TextIO] = None):
+    """
+    Run the comparison from command line options, or prompt for the inputs without options.
+    
+    Parameters:
+      argv (List[str]): Command line arguments (defaults to sys.argv[1:]).
+      output_stream (TextIO): Where to write the report (defaults to sys.stdout).
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    print("Pension Scheme Comparison: UPS vs NPS", file=output_stream)
+    print("-------------------------------------", file=output_stream)
+    
+    # Without options the inputs are prompted for, which also reads answers piped into stdin
+    if not argv:
+        args = _prompt_inputs()
+        if args is None:
+            return
+    else:
+        args = _build_parser().parse_args(argv)
+    
+    current_age = args.current_age
+    retirement_age = args.retirement_age
+    current_salary = args.current_salary * 100000
+    growth_rate = args.growth_rate
+    existing_corpus = args.existing_corpus * 100000
+    total_contrib_rate = args.employee_rate + args.employer_rate
+    annual_return = args.annual_return
+    annuity_rate = args.annuity_rate
+    post_ret_growth = args.post_ret_growth
+    corpus_return = args.corpus_return
+    employee_life_years = args.employee_life_years
+    spouse_additional_years = args.spouse_additional_years
+    
+    # Compute service years from the age when the user joined government service
+    years_of_service = retirement_age - args.join_age
+    if years_of_service < 0:
+        print("Join age must be less than or equal to retirement age.", file=output_stream)
         return
     
     years_to_retirement = retirement_age - current_age
     if years_to_retirement <= 0:
-        print("Retirement age must be greater than current age.")
+        print("Retirement age must be greater than current age.", file=output_stream)
         return
     
     # Calculate UPS pension and lump sum
-    final_salary = calculate_final_salary(current_salary, growth_rate, years_to_retirement)
-    ups_monthly = calculate_ups_monthly_pension(final_salary, years_of_service)
-    ups_lump_sum_amount = calculate_ups_lump_sum(final_salary, years_of_service)
+    final_salary, ups_monthly, ups_lump_sum_amount = calculate_ups_bundle(
+        current_salary, growth_rate, years_to_retirement, years_of_service)
 
-    # Calculate NPS corpus and pension
-    corpus = calculate_nps_corpus(current_salary, growth_rate, years_to_retirement, 
-                                total_contrib_rate, annual_return, existing_corpus)
-    nps_monthly = calculate_nps_monthly_pension(corpus, annuity_rate)
-    
-    # NPS lump sum (60% of corpus)
-    nps_lump_sum = corpus * NPS_LUMP_SUM_PORTION
+    # Calculate NPS corpus, pension and lump sum (60% of corpus)
+    corpus, nps_monthly, nps_lump_sum = calculate_nps_bundle(
+        current_salary, growth_rate, years_to_retirement, total_contrib_rate,
+        annual_return, existing_corpus, annuity_rate)
 
     # Calculate total pension coverage period needed
     total_coverage_needed = max(employee_life_years, employee_life_years + spouse_additional_years)
     
     # Output the results
-    print("\nEstimated Results at Retirement:")
-    print(f"  Final basic salary: {format_amount(final_salary)}")
-    print(f"  UPS estimated monthly pension (employee): {format_amount(ups_monthly)}")
-    print(f"  UPS estimated monthly pension (spouse): {format_amount(ups_monthly * UPS_SPOUSE_FACTOR)}")
-    print(f"  UPS lump sum amount: {format_amount(ups_lump_sum_amount)}")
+    print("\nEstimated Results at Retirement:", file=output_stream)
+    print(f"  Final basic salary: {format_amount(final_salary)}", file=output_stream)
+    print(f"  UPS estimated monthly pension (employee): {format_amount(ups_monthly)}", file=output_stream)
+    print(f"  UPS estimated monthly pension (spouse): {format_amount(ups_monthly * UPS_SPOUSE_FACTOR)}", file=output_stream)
+    print(f"  UPS lump sum amount: {format_amount(ups_lump_sum_amount)}", file=output_stream)
     if ups_lump_sum_amount > 0 and total_coverage_needed > 0 and corpus_return > 0:
         projected_ups_lump_sum = ups_lump_sum_amount * ((1 + corpus_return) ** total_coverage_needed)
-        print(f"    (Projected value after {total_coverage_needed} years if invested at {corpus_return:.2%}: {format_amount(projected_ups_lump_sum)})")
-    print(f"  Yearly UPS return on investment: {format_amount(ups_lump_sum_amount * corpus_return)}")
+        print(f"    (Projected value after {total_coverage_needed} years if invested at {corpus_return:.2%}: {format_amount(projected_ups_lump_sum)})", file=output_stream)
+    print(f"  Yearly UPS return on investment: {format_amount(ups_lump_sum_amount * corpus_return)}", file=output_stream)
 
-    print(f"  NPS accumulated corpus: {format_amount(corpus)}")
-    print(f"  NPS estimated monthly pension (constant for both): {format_amount(nps_monthly)}")
-    print(f"  NPS lump sum amount (60%): {format_amount(nps_lump_sum)})")
+    print(f"  NPS accumulated corpus: {format_amount(corpus)}", file=output_stream)
+    print(f"  NPS estimated monthly pension (constant for both): {format_amount(nps_monthly)}", file=output_stream)
+    print(f"  NPS lump sum amount (60%): {format_amount(nps_lump_sum)})", file=output_stream)
     
     # Life expectancy analysis (display values used for total_coverage_needed)
-    print("\nLife Expectancy Analysis:")
-    print(f"  Employee expected to live for {employee_life_years} years after retirement")
-    print(f"  Spouse expected to live for additional {spouse_additional_years} years")
-    print(f"  Total years of pension coverage needed: {total_coverage_needed}") # Displaying it
+    print("\nLife Expectancy Analysis:", file=output_stream)
+    print(f"  Employee expected to live for {employee_life_years} years after retirement", file=output_stream)
+    print(f"  Spouse expected to live for additional {spouse_additional_years} years", file=output_stream)
+    print(f"  Total years of pension coverage needed: {total_coverage_needed}", file=output_stream) # Displaying it
     if spouse_additional_years < 0:
-        print("  Note: Since spouse's additional years is negative, coverage is needed only until employee's death")
+        print("  Note: Since spouse's additional years is negative, coverage is needed only until employee's death", file=output_stream)
     
     # Calculate how long the NPS 60% corpus will last
     # Calculate how long the NPS 60% corpus will last, including UPS lump sum investment
@@ -302,20 +649,21 @@ def main():
         spouse_additional_years,
         post_ret_growth,
         corpus_return,
-        ups_lump_sum_amount
+        ups_lump_sum_amount,
+        output_stream=output_stream
     )
     
     # Post-retirement analysis for NPS lump sum
-    print("\nPost-Retirement Analysis (for NPS lump sum):")
+    print("\nPost-Retirement Analysis (for NPS lump sum):", file=output_stream)
     if depletion_years == float('inf'):
-        print("  The NPS corpus will NEVER deplete as the post-tax investment returns")
-        print("  cover the pension difference perpetually!")
+        print("  The NPS corpus will NEVER deplete as the post-tax investment returns", file=output_stream)
+        print("  cover the pension difference perpetually!", file=output_stream)
     else:
-        print(f"  The NPS corpus will last approximately {depletion_years:.1f} years")
+        print(f"  The NPS corpus will last approximately {depletion_years:.1f} years", file=output_stream)
         if depletion_years < total_coverage_needed:
             shortfall_years = total_coverage_needed - depletion_years
-            print(f"  WARNING: This is {shortfall_years:.1f} years short of the total needed coverage period!")
-        print("  while covering the difference between UPS and NPS pensions")
+            print(f"  WARNING: This is {shortfall_years:.1f} years short of the total needed coverage period!", file=output_stream)
+        print("  while covering the difference between UPS and NPS pensions", file=output_stream)
         # Calculate minimum post-tax return rate on 60% corpus to last perpetually
         yearly_ups = ups_monthly * MONTHS_PER_YEAR
         yearly_nps = nps_monthly * MONTHS_PER_YEAR
@@ -323,9 +671,9 @@ def main():
         # Ensure nps_lump_sum is not zero to avoid division by zero error
         if nps_lump_sum > 0:
             min_return_rate = difference / nps_lump_sum
-            print(f"  Minimum post-tax return rate on the NPS 60% corpus to last perpetually: {min_return_rate:.2%}")
+            print(f"  Minimum post-tax return rate on the NPS 60% corpus to last perpetually: {min_return_rate:.2%}", file=output_stream)
         else:
-            print("  NPS lump sum is zero, cannot calculate minimum return rate for perpetuity.")
+            print("  NPS lump sum is zero, cannot calculate minimum return rate for perpetuity.", file=output_stream)
 
 if __name__ == '__main__':
     main()
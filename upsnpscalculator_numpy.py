@@ -0,0 +1,223 @@
+# Copyright (C) 2025 Yogesh Wadadekar
+# This program is licensed under GPL v3. See LICENSE file for details.
+
+"""
+Vectorized versions of the UPS vs NPS calculator functions.
+
+Each function takes scalars or array-likes for any argument, broadcasts them
+against each other and returns a NumPy array with one result per scenario,
+so parameter sweeps run as a few array operations instead of a Python loop.
+nps_contribution_schedule instead breaks a single scenario's corpus down by year.
+calculate_corpus_depletion_years_batch steps the post-retirement corpus of every
+scenario forward together, one year per iteration.
+Requires NumPy; upsnpscalculator.py itself has no third-party dependencies.
+"""
+
+import numpy as np
+
+from upsnpscalculator import (UPS_PENSION_FACTOR, UPS_SPOUSE_FACTOR, NPS_ANNUITY_PORTION,
+                              MONTHS_PER_YEAR)
+
+def calculate_final_salary_batch(current_salary, growth_rate, years) -> np.ndarray:
+    """
+    Calculate final basic salaries for many scenarios at once.
+
+    Parameters:
+      current_salary (array-like): Current basic salaries.
+      growth_rate (array-like): Expected annual salary growth rates.
+      years (array-like): Numbers of years until retirement.
+
+    Returns:
+      np.ndarray: Estimated final basic salaries.
+    """
+    current_salary, growth_rate, years = np.broadcast_arrays(
+        np.asarray(current_salary, dtype=float), np.asarray(growth_rate, dtype=float),
+        np.asarray(years, dtype=float))
+    return current_salary * ((1 + growth_rate) ** years)
+
+def calculate_ups_monthly_pension_batch(final_salary, years_of_service) -> np.ndarray:
+    """
+    Calculate monthly UPS pensions for many scenarios at once.
+
+    Parameters:
+      final_salary (array-like): Final basic salaries.
+      years_of_service (array-like): Numbers of years worked (max 25 for full pension).
+
+    Returns:
+      np.ndarray: Monthly pensions.
+    """
+    final_salary, years_of_service = np.broadcast_arrays(
+        np.asarray(final_salary, dtype=float), np.asarray(years_of_service, dtype=float))
+    employee_factor = np.minimum(years_of_service / 25, 1.0) * UPS_PENSION_FACTOR
+    return employee_factor * final_salary / MONTHS_PER_YEAR
+
+def calculate_nps_corpus_batch(current_salary, growth_rate, years, total_contrib_rate,
+                               annual_return, existing_corpus=0.0) -> np.ndarray:
+    """
+    Calculate NPS corpora for many scenarios at once.
+
+    Contributions are laid out on a (scenario, year) grid up to the longest
+    contribution period; years beyond a scenario's own period are masked out.
+
+    Parameters:
+      current_salary (array-like): Current basic salaries.
+      growth_rate (array-like): Annual salary growth rates.
+      years (array-like): Numbers of years of contributions (integers).
+      total_contrib_rate (array-like): Total contribution rates (employee + employer).
+      annual_return (array-like): Expected annual returns on contributions.
+      existing_corpus (array-like): Already accumulated NPS corpora.
+
+    Returns:
+      np.ndarray: Total corpora accumulated at retirement.
+    """
+    arrays = np.broadcast_arrays(
+        np.asarray(current_salary, dtype=float), np.asarray(growth_rate, dtype=float),
+        np.asarray(years, dtype=int), np.asarray(total_contrib_rate, dtype=float),
+        np.asarray(annual_return, dtype=float), np.asarray(existing_corpus, dtype=float))
+    shape = arrays[0].shape
+    current_salary, growth_rate, years, total_contrib_rate, annual_return, existing_corpus = (
+        a.reshape(-1) for a in arrays)
+
+    corpus = existing_corpus * ((1 + annual_return) ** years)
+    max_years = int(years.max(initial=0))
+    if max_years > 0:
+        i = np.arange(1, max_years + 1)[None, :]
+        years_col = years[:, None]
+        active = i <= years_col
+        # Masked-out years get exponent 0 so they cannot overflow
+        years_to_compound = np.where(active, years_col - i, 0)
+        factors = ((1 + growth_rate[:, None]) ** np.where(active, i, 0)
+                   * (1 + annual_return[:, None]) ** years_to_compound)
+        corpus = corpus + total_contrib_rate * current_salary * np.sum(factors, axis=1, where=active)
+    return corpus.reshape(shape)
+
+def nps_contribution_schedule(current_salary: float, growth_rate: float, years: int,
+                              total_contrib_rate: float, annual_return: float) -> np.ndarray:
+    """
+    Calculate the value at retirement of each year's NPS contribution.
+
+    The entries sum to calculate_nps_corpus(...) without an existing corpus, so the
+    schedule shows how much each contribution year adds to the final corpus.
+
+    Parameters:
+      current_salary (float): Current basic salary.
+      growth_rate (float): Annual salary growth rate.
+      years (int): Number of years of contributions.
+      total_contrib_rate (float): Total contribution rate (employee + employer).
+      annual_return (float): Expected annual return on contributions.
+
+    Returns:
+      np.ndarray: Compounded contribution for years 1..years (empty if years <= 0).
+    """
+    i = np.arange(1, max(years, 0) + 1, dtype=np.float64)
+    contributions = total_contrib_rate * current_salary * np.power(1.0 + growth_rate, i)
+    return contributions * np.power(1.0 + annual_return, years - i)
+
+def calculate_nps_monthly_pension_batch(corpus, annuity_rate) -> np.ndarray:
+    """
+    Calculate monthly NPS pensions for many scenarios at once.
+
+    Parameters:
+      corpus (array-like): Total corpora accumulated.
+      annuity_rate (array-like): Annual annuity conversion rates.
+
+    Returns:
+      np.ndarray: Estimated monthly pensions.
+    """
+    corpus, annuity_rate = np.broadcast_arrays(
+        np.asarray(corpus, dtype=float), np.asarray(annuity_rate, dtype=float))
+    return NPS_ANNUITY_PORTION * corpus * annuity_rate / MONTHS_PER_YEAR
+
+def calculate_corpus_depletion_years_batch(initial_corpus, ups_monthly_initial, nps_monthly,
+                                           employee_life_years, spouse_additional_years,
+                                           post_ret_growth=0.05, corpus_return=0.08,
+                                           ups_lump_sum=0.0) -> np.ndarray:
+    """
+    Calculate how many years the NPS lump sum corpus lasts for many scenarios at once.
+
+    The UPS income of every year is precomputed up front: the pension growth is a
+    running product along the year axis and the spouse factor a mask. The corpus
+    itself only draws on the withdrawal in years where UPS income exceeds NPS
+    income, so it is stepped forward one year at a time for all scenarios together.
+    Results match calculate_corpus_depletion_years for each scenario.
+
+    Parameters:
+      initial_corpus (array-like): NPS lump sum corpora available.
+      ups_monthly_initial (array-like): Initial monthly UPS pensions.
+      nps_monthly (array-like): Monthly NPS annuities (constant).
+      employee_life_years (array-like): Expected years employee will live after retirement.
+      spouse_additional_years (array-like): Additional years spouse will live after employee's death.
+      post_ret_growth (array-like): Annual growth rates of UPS pension.
+      corpus_return (array-like): Annual returns on remaining corpus.
+      ups_lump_sum (array-like): UPS lump sums invested to earn returns.
+
+    Returns:
+      np.ndarray: Number of years each corpus lasts, or inf where it never depletes.
+    """
+    arrays = np.broadcast_arrays(
+        np.asarray(initial_corpus, dtype=float), np.asarray(ups_monthly_initial, dtype=float),
+        np.asarray(nps_monthly, dtype=float), np.asarray(employee_life_years, dtype=int),
+        np.asarray(spouse_additional_years, dtype=int), np.asarray(post_ret_growth, dtype=float),
+        np.asarray(corpus_return, dtype=float), np.asarray(ups_lump_sum, dtype=float))
+    shape = arrays[0].shape
+    (initial_corpus, ups_monthly_initial, nps_monthly, employee_life_years,
+     spouse_additional_years, post_ret_growth, corpus_return, ups_lump_sum) = (
+        a.reshape(-1) for a in arrays)
+
+    total_years = employee_life_years + spouse_additional_years
+    ups_return = ups_lump_sum * corpus_return
+    yearly_nps = nps_monthly * MONTHS_PER_YEAR
+    simulated = (initial_corpus > 0) & (total_years > 0)
+
+    # Same perpetual check as the scalar version, on the first simulated year
+    first_factor = np.where(employee_life_years <= 0, UPS_SPOUSE_FACTOR, 1.0)
+    never_depletes = simulated & (
+        yearly_nps + initial_corpus * corpus_return
+        >= ups_monthly_initial * first_factor * MONTHS_PER_YEAR + ups_return)
+
+    years = np.zeros(initial_corpus.shape, dtype=int)
+    max_years = int(total_years.max(initial=0))
+    if max_years > 0:
+        # Running product of [ups, g, g, ...] repeats the scalar loop's multiplications exactly
+        ups_monthly = np.empty((initial_corpus.size, max_years))
+        ups_monthly[:, 0] = ups_monthly_initial
+        ups_monthly[:, 1:] = (1 + post_ret_growth)[:, None]
+        np.cumprod(ups_monthly, axis=1, out=ups_monthly)
+        spouse_phase = np.arange(max_years)[None, :] >= employee_life_years[:, None]
+        ups_monthly *= np.where(spouse_phase, UPS_SPOUSE_FACTOR, 1.0)
+        total_ups_income = ups_monthly * MONTHS_PER_YEAR + ups_return[:, None]
+
+        corpus = initial_corpus.copy()
+        corpus_growth = 1 + corpus_return
+        active = simulated & ~never_depletes
+        for year in range(max_years):
+            active &= (corpus > 0) & (year < total_years)
+            if not active.any():
+                break
+            yearly_difference = total_ups_income[:, year] - (yearly_nps + corpus * corpus_return)
+            withdrawn = np.where(yearly_difference > 0, corpus - yearly_difference, corpus)
+            corpus = np.where(active, withdrawn * corpus_growth, corpus)
+            years += active
+    return np.where(never_depletes, np.inf, years).reshape(shape)
+
+def sweep_depletion(params, chunk_size=65536) -> np.ndarray:
+    """
+    Calculate corpus depletion years for a grid of parameter combinations.
+
+    Each row holds the eight arguments of calculate_corpus_depletion_years in order.
+    The rows are processed chunk_size at a time so that the per-year UPS income grid
+    of calculate_corpus_depletion_years_batch stays bounded for large sweeps.
+
+    Parameters:
+      params (array-like): Array of shape (N, 8), one parameter combination per row.
+      chunk_size (int): Number of rows evaluated per batch call.
+
+    Returns:
+      np.ndarray: Number of years each corpus lasts (inf where it never depletes), shape (N,).
+    """
+    params = np.asarray(params, dtype=float).reshape(-1, 8)
+    out = np.empty(params.shape[0], dtype=np.float64)
+    for start in range(0, params.shape[0], chunk_size):
+        out[start:start + chunk_size] = calculate_corpus_depletion_years_batch(
+            *params[start:start + chunk_size].T)
+    return out